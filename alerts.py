@@ -1,28 +1,34 @@
-import streamlit as st
-
-def render(df):
-    st.subheader("Alert Feed & Incident Summary")
-    st.markdown("Lists failed checks and incidents detected from Databricks validation results.")
-
-    failed_records = df[df['Status'] == 'Failed'].copy()
-
-    if not failed_records.empty:
-        alert_feed = failed_records[['Run_Timestamp', 'Table', 'Rule_Display_Name', 'Status', 'Failure_Type']].copy()
-        alert_feed.rename(columns={
-            'Run_Timestamp': 'Time',
-            'Table': 'Table',
-            'Rule_Display_Name': 'Rule',
-            'Status': 'Status',
-            'Failure_Type': 'Message'
-        }, inplace=True)
-
-        critical_rules = ["No Nulls", "Unique Values", "Primary Key Present", "Foreign Key Valid"]
-        alert_feed['Severity'] = alert_feed['Rule'].apply(lambda x: 'Critical' if x in critical_rules else 'Warning')
-
-        alert_feed.sort_values(by='Time', ascending=False, inplace=True)
-        st.dataframe(alert_feed, use_container_width=True)
-        st.success(f"Displaying {len(alert_feed)} failed checks from live validation results.")
-    else:
-        st.info("No failed checks currently detected from Databricks validation results.")
-
-    st.info("Integrate with Slack/email APIs for production notifications.")
+import streamlit as st
+import numpy as np
+
+# Rules whose failures are severe enough to page on; frozenset for O(1) membership
+CRITICAL_RULES = frozenset({"No Nulls", "Unique Values", "Primary Key Present", "Foreign Key Valid"})
+
+def render(df):
+    st.subheader("Alert Feed & Incident Summary")
+    st.markdown("Lists failed checks and incidents detected from Databricks validation results.")
+
+    failed_mask = df['Status'].eq('Failed')
+
+    if failed_mask.any():
+        # Project and filter in one .loc so only the needed columns of the
+        # failed subset are ever materialized
+        alert_feed = (
+            df.loc[failed_mask, ['Run_Timestamp', 'Table', 'Rule_Display_Name', 'Status', 'Failure_Type']]
+            .rename(columns={
+                'Run_Timestamp': 'Time',
+                'Rule_Display_Name': 'Rule',
+                'Failure_Type': 'Message'
+            })
+            .reset_index(drop=True)
+        )
+
+        alert_feed['Severity'] = np.where(alert_feed['Rule'].isin(CRITICAL_RULES), 'Critical', 'Warning')
+
+        alert_feed.sort_values(by='Time', ascending=False, inplace=True, kind='mergesort')
+        st.dataframe(alert_feed, use_container_width=True)
+        st.success(f"Displaying {len(alert_feed)} failed checks from live validation results.")
+    else:
+        st.info("No failed checks currently detected from Databricks validation results.")
+
+    st.info("Integrate with Slack/email APIs for production notifications.")
@@ -1,12 +1,32 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from sklearn.ensemble import IsolationForest
-from scipy.stats import zscore
+from utils import to_csv_bytes
+
+def _zscore_anomaly_mask(values, thresh=3.0):
+    """Fused z-score threshold pass: flags rows where any column deviates
+    more than `thresh` standard deviations, without materializing the
+    intermediate z-score frame."""
+    means = values.mean(axis=0)
+    stds = values.std(axis=0)
+    stds[stds == 0] = np.inf  # constant columns can never be outliers
+    return (np.abs(values - means) > thresh * stds).any(axis=1)
+
+# Keyed on the raw bytes of the selected data, so repeating a detection on
+# unchanged inputs reuses the fitted model instead of re-growing the trees.
+@st.cache_resource
+def _fit_iforest(values_bytes, n_cols):
+    model = IsolationForest(contamination=0.05, random_state=42, n_jobs=-1)
+    model.fit(np.frombuffer(values_bytes).reshape(-1, n_cols))
+    return model
 
 def render(df):
     CANDIDATE_NUMERIC_COLS = ["Failed_Value", "Failed_Row_ID"]
     for col in CANDIDATE_NUMERIC_COLS:
-        if col in df.columns:
+        # Skip the coercion when the source already ships a typed numeric
+        # view (e.g. Failed_Value_num from the enhanced data factory)
+        if col in df.columns and col + "_num" not in df.columns:
             df[col + "_num"] = pd.to_numeric(df[col], errors="coerce")
 
     st.subheader("Anomaly Detection")
@@ -25,17 +45,16 @@ def render(df):
                 st.warning("No complete rows for selected columns after dropping NA.")
             else:
                 if method == "Z-Score":
-                    z_scores = zscore(df_selected)
-                    z_df = pd.DataFrame(z_scores, columns=selected_cols, index=df_selected.index)
-                    anomaly_mask = (z_df.abs() > 3).any(axis=1)
+                    anomaly_mask = _zscore_anomaly_mask(df_selected.to_numpy(dtype=np.float64))
                 else:
-                    model = IsolationForest(contamination=0.05, random_state=42)
-                    anomaly_mask = model.fit_predict(df_selected.fillna(0)) == -1
+                    values = df_selected.to_numpy(dtype=np.float64)
+                    model = _fit_iforest(values.tobytes(), values.shape[1])
+                    anomaly_mask = model.predict(values) == -1
                 
                 anomalies = df.loc[df_selected.index[anomaly_mask]]
                 st.dataframe(anomalies, use_container_width=True)
                 st.download_button(
                     "⬇️ Download Anomalies",
-                    anomalies.to_csv(index=False),
+                    to_csv_bytes(anomalies),
                     "anomalies.csv"
                 )
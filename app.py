@@ -1,6 +1,9 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
+
+# Copy-on-write makes .copy() lazy and avoids defensive whole-frame copies
+pd.set_option("mode.copy_on_write", True)
 import base64
 import os
 import sys
@@ -31,7 +34,9 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # 📷 Logo Encoding with Caching
-@st.cache_data
+# cache_resource is process-global: the file is read and encoded once per
+# server process, with no per-rerun hashing of the cached value
+@st.cache_resource
 def get_base64_image(path):
     try:
         with open(path, "rb") as f:
@@ -86,7 +91,7 @@ elif st.session_state.refresh_mode == "Specific Date/Time":
 # 🧑‍💻 Load Data
 if "df" not in st.session_state or need_refresh:
     try:
-        st.session_state["df"] = load_data_from_databricks()
+        st.session_state["df"] = load_data_from_databricks(st.session_state["METADATA"]["schema"])
         st.session_state.last_refresh = now
         initialize_metadata(st.session_state["df"])
     except Exception as e:
@@ -97,25 +102,37 @@ if "df" not in st.session_state or need_refresh:
 if selected_page != "About AutoDQ":
     if st.button("Refresh from Databricks"):
         try:
-            st.session_state["df"] = load_data_from_databricks()
+            st.session_state["df"] = load_data_from_databricks(st.session_state["METADATA"]["schema"])
             st.session_state["last_refresh"] = now
             initialize_metadata(st.session_state["df"])
             st.rerun()
         except Exception as e:
             st.error(f"Failed to refresh data: {e}")
 
-# 🪜 Preprocess DataFrame
-df = st.session_state.get("df", pd.DataFrame())
-if not df.empty:
+# 🪜 Preprocess DataFrame (cached so the string work only reruns after an actual reload)
+@st.cache_data
+def _preprocess(_df_raw, refresh_ts):
+    df = _df_raw.copy()
     df.columns = df.columns.str.strip()
     for col in ['Table', 'Column']:
         if col in df.columns:
             df[col] = df[col].str.strip()
     df['Table'] = df['Table'].str.lower()
-    df['Table.Column'] = df['Table'].astype(str) + '.' + df['Column'].astype(str)
+    df['Table.Column'] = df['Table'].str.cat(df['Column'], sep='.')
+    # Low-cardinality string columns become categoricals once, so downstream
+    # groupby/isin/value_counts compare integer codes instead of hashing strings
+    for col in ('Table', 'Column', 'Status', 'Rule_Display_Name', 'Failure_Type', 'Table.Column'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
     if "Run_Timestamp" in df.columns:
         df["Run_Timestamp"] = pd.to_datetime(df["Run_Timestamp"], errors="coerce")
         df.dropna(subset=["Run_Timestamp"], inplace=True)
+    return df
+
+df = st.session_state.get("df", pd.DataFrame())
+if not df.empty:
+    df = _preprocess(df, st.session_state.last_refresh)
+    st.session_state["df"] = df
 else:
     if selected_page != "About AutoDQ":
         st.warning("No data loaded. Please check settings or refresh from Databricks.")
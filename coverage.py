@@ -1,43 +1,57 @@
-import streamlit as st
-from st_aggrid import AgGrid, GridOptionsBuilder, JsCode
-
-def render(df):
-    st.subheader("Check Coverage Overview")
-    st.markdown("This heatmap shows which tables and columns have active data quality checks and which do not. Areas with no checks are 'blind spots'.")
-
-    coverage = (
-        df.groupby(['Table', 'Column'])['Rule_Display_Name']
-        .nunique().unstack(fill_value=0).reset_index()
-    )
-
-    gb = GridOptionsBuilder.from_dataframe(coverage)
-    cell_style_jscode = JsCode("""
-    function(params) {
-        if (params.value == 0) {
-            return { 'backgroundColor': '#f8d7da', 'color': 'black' } // Soft Red
-        } else if (params.value <= 10) {
-            return { 'backgroundColor': '#fff3cd', 'color': 'black' } // Soft Yellow
-        } else {
-            return { 'backgroundColor': '#d4edda', 'color': 'black' } // Soft Green
-        }
-    };
-    """)
-
-    for col in coverage.columns[1:]:
-        gb.configure_column(col, cellStyle=cell_style_jscode, tooltipField=col)
-
-    gb.configure_column("Table", pinned="left", headerName="Table Name", width=180)
-    gb.configure_default_column(resizable=True, sortable=True, filter=True)
-    gb.configure_grid_options(domLayout='autoHeight')
-    gb.configure_side_bar()
-    gridOptions = gb.build()
-
-    AgGrid(
-        coverage,
-        gridOptions=gridOptions,
-        enable_enterprise_modules=False,
-        allow_unsafe_jscode=True,
-        theme="balham",
-        fit_columns_on_grid_load=False,
-        height=500
-    )
+import streamlit as st
+import pandas as pd
+from st_aggrid import AgGrid, GridOptionsBuilder
+
+# Declarative CSS buckets for the heatmap cells; class assignment is static
+# instead of running a JS style callback per cell
+COVERAGE_CELL_CSS = {
+    ".cov-zero": {"background-color": "#f8d7da !important", "color": "black"},  # Soft Red
+    ".cov-low": {"background-color": "#fff3cd !important", "color": "black"},   # Soft Yellow
+    ".cov-high": {"background-color": "#d4edda !important", "color": "black"},  # Soft Green
+}
+
+# Cached so navigating back to Coverage reuses the prior result until the next reload
+@st.cache_data
+def _build_coverage(_df, refresh_ts):
+    uniq = _df[['Table', 'Column', 'Rule_Display_Name']].drop_duplicates()
+    return (
+        uniq.pivot_table(index='Table', columns='Column', aggfunc='size', fill_value=0)
+        .reset_index()
+    )
+
+# Grid options only depend on the column layout, so build them once
+@st.cache_resource
+def _build_grid_options(columns):
+    gb = GridOptionsBuilder.from_dataframe(pd.DataFrame(columns=list(columns)))
+    cell_class_rules = {
+        'cov-zero': 'x == 0',
+        'cov-low': 'x > 0 && x <= 10',
+        'cov-high': 'x > 10',
+    }
+
+    for col in columns[1:]:
+        gb.configure_column(col, cellClassRules=cell_class_rules, tooltipField=col)
+
+    gb.configure_column("Table", pinned="left", headerName="Table Name", width=180)
+    gb.configure_default_column(resizable=True, sortable=True, filter=True)
+    # Row virtualization + pagination keeps the DOM bounded on wide coverage tables
+    gb.configure_grid_options(pagination=True, paginationPageSize=50, rowBuffer=20)
+    gb.configure_side_bar()
+    return gb.build()
+
+def render(df):
+    st.subheader("Check Coverage Overview")
+    st.markdown("This heatmap shows which tables and columns have active data quality checks and which do not. Areas with no checks are 'blind spots'.")
+
+    coverage = _build_coverage(df, st.session_state.get("last_refresh"))
+    gridOptions = _build_grid_options(tuple(coverage.columns))
+
+    AgGrid(
+        coverage,
+        gridOptions=gridOptions,
+        enable_enterprise_modules=False,
+        custom_css=COVERAGE_CELL_CSS,
+        theme="balham",
+        fit_columns_on_grid_load=False,
+        height=500
+    )
@@ -1,10 +1,13 @@
 import streamlit as st
 import pandas as pd
+from utils import to_csv_bytes
 
 def render(df):
     st.title("Smart Data Cleaning & Change Tracking")
 
-    cleaned_df = df.copy()
+    # Copy deferred until a cleaning option actually mutates the frame; with
+    # copy-on-write enabled in app.py the eventual copy is lazy as well
+    cleaned_df = df
     changes_log = []
 
     st.markdown("## Step 1: Apply Cleaning Options")
@@ -35,11 +38,15 @@ def render(df):
     if apply_lowercase:
         text_cols = cleaned_df.select_dtypes(include='object').columns
         changed_cols = []
-        for col in text_cols:
-            before = cleaned_df[col].copy()
-            cleaned_df[col] = cleaned_df[col].str.lower()
-            if not before.equals(cleaned_df[col]):
-                changed_cols.append(col)
+        if len(text_cols) > 0:
+            # Arrow-backed strings lowercase in vectorized C++ instead of
+            # Python-object-at-a-time, and skip the per-column copy/equals passes
+            as_arrow = cleaned_df[text_cols].astype('string[pyarrow]')
+            lowered = as_arrow.apply(lambda s: s.str.lower())
+            changed_cols = [col for col in text_cols if (as_arrow[col] != lowered[col]).any()]
+            if cleaned_df is df:
+                cleaned_df = df.copy()
+            cleaned_df[text_cols] = lowered
 
         for col in changed_cols:
             changes_log.append(["All Tables", col, "Lowercased", "Yes"])
@@ -83,4 +90,4 @@ def render(df):
         st.info("No numeric columns available for visualization.")
 
     st.markdown("---")
-    st.download_button("⬇️ Download Cleaned Data", cleaned_df.to_csv(index=False), "cleaned_data.csv")
+    st.download_button("⬇️ Download Cleaned Data", to_csv_bytes(cleaned_df), "cleaned_data.csv")
@@ -1,9 +1,12 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from databricks import sql
 import plotly.express as px
+import plotly.io as pio
 import os
 from config import DATABRICKS_HOST, DATABRICKS_TOKEN, DATABRICKS_HTTP_PATH
+from utils import to_csv_bytes
 
 # 🔧 Databricks Config from environment variables
 def get_databricks_connection_params():
@@ -17,21 +20,87 @@ def get_databricks_connection_params():
     
     return host, token, http_path
 
+# One live connection reused across reruns; the TLS+auth handshake dominates
+# latency for the small aggregate queries below
+@st.cache_resource
+def _db_conn():
+    host, token, http_path = get_databricks_connection_params()
+    return sql.connect(
+        server_hostname=host,
+        http_path=http_path,
+        access_token=token
+    )
+
 def fetch_table_data(table_name):
     """Fetch data from a specific table in Databricks"""
     try:
-        host, token, http_path = get_databricks_connection_params()
-        
-        with sql.connect(
-            server_hostname=host,
-            http_path=http_path,
-            access_token=token
-        ) as connection:
-            return pd.read_sql(f"SELECT * FROM multitable_logistics.{table_name}", connection)
+        # Columnar Arrow fetch: no per-row DB-API tuple allocation, and the
+        # pandas frame is built column-wise from the Arrow buffers
+        with _db_conn().cursor() as cursor:
+            cursor.execute(f"SELECT * FROM multitable_logistics.{table_name}")
+            return cursor.fetchall_arrow().to_pandas(self_destruct=True)
     except Exception as e:
+        _db_conn.clear()  # drop a possibly-stale connection so the next call reconnects
         st.error(f"Error fetching data from {table_name}: {e}")
         return pd.DataFrame()
 
+VALIDATION_TABLE = "multitable_logistics.gx_validation_results_cleaned_combined"
+
+@st.cache_data(ttl=600)
+def fetch_status_counts():
+    """Fetch validation status counts pre-aggregated by the warehouse"""
+    try:
+        return pd.read_sql(
+            f"SELECT Status, COUNT(*) AS Count FROM {VALIDATION_TABLE} GROUP BY Status",
+            _db_conn()
+        )
+    except Exception as e:
+        _db_conn.clear()
+        st.error(f"Error fetching status counts: {e}")
+        return pd.DataFrame()
+
+@st.cache_data(ttl=600)
+def fetch_rule_failure_counts(top_n=10):
+    """Fetch the most-failed rules, aggregated and limited server-side"""
+    try:
+        return pd.read_sql(
+            f"""
+            SELECT Rule_Display_Name, COUNT(*) AS Count
+            FROM {VALIDATION_TABLE}
+            WHERE Status = 'Failed'
+            GROUP BY Rule_Display_Name
+            ORDER BY Count DESC
+            LIMIT {int(top_n)}
+            """,
+            _db_conn()
+        )
+    except Exception as e:
+        _db_conn.clear()
+        st.error(f"Error fetching rule failure counts: {e}")
+        return pd.DataFrame()
+
+@st.cache_data(ttl=600)
+def fetch_daily_counts(start_date=None, end_date=None):
+    """Fetch per-day validation counts by status, grouped in the warehouse"""
+    try:
+        date_filter = ""
+        if start_date is not None and end_date is not None:
+            date_filter = f"WHERE CAST(Run_Timestamp AS DATE) BETWEEN '{start_date}' AND '{end_date}'"
+
+        return pd.read_sql(
+            f"""
+            SELECT CAST(Run_Timestamp AS DATE) AS Run_Date, Status, COUNT(*) AS Count
+            FROM {VALIDATION_TABLE}
+            {date_filter}
+            GROUP BY CAST(Run_Timestamp AS DATE), Status
+            """,
+            _db_conn()
+        )
+    except Exception as e:
+        _db_conn.clear()
+        st.error(f"Error fetching daily counts: {e}")
+        return pd.DataFrame()
+
 def plot_cleaning_status_summary(df):
     """Plot cleaning status summary"""
     if 'status' in df.columns:
@@ -72,70 +141,89 @@ def plot_anomaly_count_by_table(df):
         st.plotly_chart(fig, use_container_width=True)
         st.markdown("---")
 
+# Shared status palette; figure builders below are cached on their small
+# aggregated inputs so unchanged data skips the Plotly build + JSON encode
+STATUS_COLORS = {
+    'Passed': '#2E8B57',
+    'Failed': '#DC143C',
+    'Warning': '#FF8C00'
+}
+
+@st.cache_data
+def _status_pie_json(counts):
+    fig = px.pie(
+        values=[c for _, c in counts],
+        names=[s for s, _ in counts],
+        title="Validation Status Distribution",
+        color_discrete_map=STATUS_COLORS
+    )
+    return fig.to_json()
+
 def plot_validation_status_pie(df):
     """Plot validation status distribution as pie chart"""
     if 'Status' in df.columns:
         status_counts = df['Status'].value_counts()
-        
-        fig = px.pie(
-            values=status_counts.values,
-            names=status_counts.index,
-            title="Validation Status Distribution",
-            color_discrete_map={
-                'Passed': '#2E8B57',
-                'Failed': '#DC143C',
-                'Warning': '#FF8C00'
-            }
-        )
+
+        fig = pio.from_json(_status_pie_json(tuple(status_counts.items())))
         st.plotly_chart(fig, use_container_width=True)
         st.markdown("---")
 
-def plot_rule_failure_frequency(df):
-    """Plot rule failure frequency"""
-    if 'Rule_Display_Name' in df.columns and 'Status' in df.columns:
-        failed_df = df[df['Status'] == 'Failed']
+@st.cache_data
+def _rule_failure_bar_json(counts):
+    fig = px.bar(
+        x=[c for _, c in counts],
+        y=[r for r, _ in counts],
+        orientation='h',
+        title="Top 10 Most Failed Rules",
+        labels={'x': 'Failure Count', 'y': 'Rule Name'},
+        color=[c for _, c in counts],
+        color_continuous_scale='Reds'
+    )
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+    return fig.to_json()
+
+def plot_rule_failure_frequency(failed_df):
+    """Plot rule failure frequency from the pre-filtered failed slice"""
+    if 'Rule_Display_Name' in failed_df.columns:
         if not failed_df.empty:
             rule_counts = failed_df['Rule_Display_Name'].value_counts().head(10)
-            
-            fig = px.bar(
-                x=rule_counts.values,
-                y=rule_counts.index,
-                orientation='h',
-                title="Top 10 Most Failed Rules",
-                labels={'x': 'Failure Count', 'y': 'Rule Name'},
-                color=rule_counts.values,
-                color_continuous_scale='Reds'
-            )
-            fig.update_layout(yaxis={'categoryorder':'total ascending'})
+
+            fig = pio.from_json(_rule_failure_bar_json(tuple(rule_counts.items())))
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No failed validations found.")
         st.markdown("---")
 
+@st.cache_data
+def _timeline_json(daily_counts):
+    fig = px.line(
+        daily_counts,
+        x='Run_Date',
+        y='Count',
+        color='Status',
+        title="Validation Trends Over Time",
+        markers=True,
+        color_discrete_map=STATUS_COLORS
+    )
+    fig.update_layout(xaxis_title="Date", yaxis_title="Number of Validations")
+    return fig.to_json()
+
 def plot_timeline_trends(df):
     """Plot validation trends over time"""
     if 'Run_Timestamp' in df.columns and 'Status' in df.columns:
-        # Convert timestamp and group by date
-        df['Run_Date'] = pd.to_datetime(df['Run_Timestamp']).dt.date
-        
+        # Reuse the date column precomputed in render(); only derive it here
+        # when called standalone with unparsed timestamps
+        if 'Run_Date' not in df.columns:
+            ts = df['Run_Timestamp']
+            if not pd.api.types.is_datetime64_any_dtype(ts):
+                ts = pd.to_datetime(ts, errors='coerce', cache=True)
+            df = df.assign(Run_Date=ts.values.astype('datetime64[D]'))
+
         # Group by date and status
         daily_counts = df.groupby(['Run_Date', 'Status']).size().reset_index(name='Count')
         
         if not daily_counts.empty:
-            fig = px.line(
-                daily_counts,
-                x='Run_Date',
-                y='Count',
-                color='Status',
-                title="Validation Trends Over Time",
-                markers=True,
-                color_discrete_map={
-                    'Passed': '#2E8B57',
-                    'Failed': '#DC143C',
-                    'Warning': '#FF8C00'
-                }
-            )
-            fig.update_layout(xaxis_title="Date", yaxis_title="Number of Validations")
+            fig = pio.from_json(_timeline_json(daily_counts))
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No timeline data available.")
@@ -162,7 +250,11 @@ def render(df):
         
         # Date range filter
         if 'Run_Timestamp' in df.columns:
-            df['Run_Timestamp'] = pd.to_datetime(df['Run_Timestamp'], errors='coerce')
+            # app.py usually hands us an already-parsed column; only pay for
+            # to_datetime when the data arrived as strings
+            if not pd.api.types.is_datetime64_any_dtype(df['Run_Timestamp']):
+                df['Run_Timestamp'] = pd.to_datetime(df['Run_Timestamp'], errors='coerce', cache=True)
+            df['Run_Date'] = df['Run_Timestamp'].values.astype('datetime64[D]')
             min_date = df['Run_Timestamp'].min().date()
             max_date = df['Run_Timestamp'].max().date()
             
@@ -176,37 +268,42 @@ def render(df):
             if len(date_range) == 2:
                 start_date, end_date = date_range
                 df = df[
-                    (df['Run_Timestamp'].dt.date >= start_date) & 
-                    (df['Run_Timestamp'].dt.date <= end_date)
+                    (df['Run_Date'] >= pd.Timestamp(start_date)) &
+                    (df['Run_Date'] <= pd.Timestamp(end_date))
                 ]
     
+    # Scan the Status column once; every consumer below reuses the slice/count
+    if 'Status' in df.columns:
+        failed_mask = df['Status'].to_numpy() == 'Failed'
+        failed_df = df.loc[failed_mask]
+        failed_count = int(failed_mask.sum())
+    else:
+        failed_df = df.iloc[0:0]
+        failed_count = 0
+
+    # Summary stats computed once and shared with the metric tiles, export
+    # report and insights below
+    stats = {
+        'total': len(df),
+        'failed': failed_count if 'Status' in df.columns else None,
+        'tables': df['Table'].nunique(dropna=True) if 'Table' in df.columns else None,
+        'rules': df['Rule_Display_Name'].nunique(dropna=True) if 'Rule_Display_Name' in df.columns else None,
+    }
+
     # Summary metrics
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
-        total_validations = len(df)
-        st.metric("Total Validations", f"{total_validations:,}")
-    
+        st.metric("Total Validations", f"{stats['total']:,}")
+
     with col2:
-        if 'Status' in df.columns:
-            failed_count = len(df[df['Status'] == 'Failed'])
-            st.metric("Failed Validations", f"{failed_count:,}")
-        else:
-            st.metric("Failed Validations", "N/A")
-    
+        st.metric("Failed Validations", f"{stats['failed']:,}" if stats['failed'] is not None else "N/A")
+
     with col3:
-        if 'Table' in df.columns:
-            unique_tables = df['Table'].nunique()
-            st.metric("Tables Monitored", f"{unique_tables:,}")
-        else:
-            st.metric("Tables Monitored", "N/A")
-    
+        st.metric("Tables Monitored", f"{stats['tables']:,}" if stats['tables'] is not None else "N/A")
+
     with col4:
-        if 'Rule_Display_Name' in df.columns:
-            unique_rules = df['Rule_Display_Name'].nunique()
-            st.metric("Active Rules", f"{unique_rules:,}")
-        else:
-            st.metric("Active Rules", "N/A")
+        st.metric("Active Rules", f"{stats['rules']:,}" if stats['rules'] is not None else "N/A")
     
     st.markdown("---")
     
@@ -217,7 +314,7 @@ def render(df):
     
     if "Rule Failures" in analysis_options:
         st.markdown("### 🚨 Rule Failure Analysis")
-        plot_rule_failure_frequency(df)
+        plot_rule_failure_frequency(failed_df)
     
     if "Timeline Trends" in analysis_options:
         st.markdown("### 📈 Validation Trends")
@@ -227,9 +324,28 @@ def render(df):
         st.markdown("### 📋 Table-Level Analysis")
         
         if 'Table' in df.columns and 'Status' in df.columns:
-            # Table performance summary
-            table_summary = df.groupby('Table')['Status'].agg(['count', lambda x: (x == 'Failed').sum()]).reset_index()
-            table_summary.columns = ['Table', 'Total_Validations', 'Failed_Validations']
+            # Table performance summary. With categorical Table (the app.py
+            # preprocessing default) both reductions collapse to bincounts
+            # over the int codes — one cache-friendly C pass, no string hashing.
+            if isinstance(df['Table'].dtype, pd.CategoricalDtype):
+                codes = df['Table'].cat.codes.to_numpy()
+                valid = codes >= 0
+                n_groups = len(df['Table'].cat.categories)
+                totals = np.bincount(codes[valid], minlength=n_groups)
+                fails = np.bincount(codes[valid], weights=failed_mask[valid], minlength=n_groups).astype(np.int64)
+                observed = totals > 0
+                table_summary = pd.DataFrame({
+                    'Table': df['Table'].cat.categories[observed],
+                    'Total_Validations': totals[observed],
+                    'Failed_Validations': fails[observed],
+                })
+            else:
+                table_summary = (
+                    df.assign(_failed=df['Status'].eq('Failed'))
+                    .groupby('Table', sort=False)
+                    .agg(Total_Validations=('_failed', 'size'), Failed_Validations=('_failed', 'sum'))
+                    .reset_index()
+                )
             table_summary['Success_Rate'] = ((table_summary['Total_Validations'] - table_summary['Failed_Validations']) / table_summary['Total_Validations'] * 100).round(2)
             
             st.markdown("#### Table Performance Summary")
@@ -256,10 +372,10 @@ def render(df):
         if st.button("📥 Export Summary Report"):
             # Create summary report
             summary_data = {
-                'Total_Validations': [len(df)],
-                'Failed_Validations': [len(df[df['Status'] == 'Failed']) if 'Status' in df.columns else 0],
-                'Unique_Tables': [df['Table'].nunique() if 'Table' in df.columns else 0],
-                'Unique_Rules': [df['Rule_Display_Name'].nunique() if 'Rule_Display_Name' in df.columns else 0],
+                'Total_Validations': [stats['total']],
+                'Failed_Validations': [failed_count],
+                'Unique_Tables': [stats['tables'] or 0],
+                'Unique_Rules': [stats['rules'] or 0],
                 'Analysis_Date': [pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')]
             }
             
@@ -275,7 +391,7 @@ def render(df):
     
     with col2:
         if not df.empty:
-            csv_full = df.to_csv(index=False)
+            csv_full = to_csv_bytes(df)
             st.download_button(
                 label="📊 Export Full Dataset",
                 data=csv_full,
@@ -290,9 +406,8 @@ def render(df):
         insights = []
         
         if 'Status' in df.columns:
-            total_validations = len(df)
-            failed_validations = len(df[df['Status'] == 'Failed'])
-            success_rate = ((total_validations - failed_validations) / total_validations * 100) if total_validations > 0 else 0
+            total_validations = stats['total']
+            success_rate = ((total_validations - failed_count) / total_validations * 100) if total_validations > 0 else 0
             
             if success_rate >= 95:
                 insights.append("✅ Excellent data quality with >95% success rate")
@@ -301,16 +416,17 @@ def render(df):
             else:
                 insights.append("🚨 Data quality issues detected - immediate attention required")
         
-        if 'Rule_Display_Name' in df.columns and 'Status' in df.columns:
-            failed_df = df[df['Status'] == 'Failed']
-            if not failed_df.empty:
-                most_failed_rule = failed_df['Rule_Display_Name'].value_counts().index[0]
-                insights.append(f"🎯 Most problematic rule: {most_failed_rule}")
+        if 'Rule_Display_Name' in df.columns and not failed_df.empty:
+            most_failed_rule = failed_df['Rule_Display_Name'].value_counts().index[0]
+            insights.append(f"🎯 Most problematic rule: {most_failed_rule}")
         
         if 'Table' in df.columns and 'Status' in df.columns:
-            table_failure_rates = df.groupby('Table').apply(
-                lambda x: (x['Status'] == 'Failed').sum() / len(x) * 100
-            ).sort_values(ascending=False)
+            table_failure_rates = (
+                df['Status'].eq('Failed')
+                .groupby(df['Table'], sort=False)
+                .mean().mul(100)
+                .sort_values(ascending=False)
+            )
             
             if not table_failure_rates.empty:
                 worst_table = table_failure_rates.index[0]
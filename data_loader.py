@@ -1,6 +1,11 @@
 # data_loader.py
 
+import contextlib
+import functools
+import queue
+
 import pandas as pd
+import pyarrow as pa
 from databricks import sql
 import streamlit as st
 from datetime import datetime
@@ -8,19 +13,90 @@ import os
 from config import DEFAULT_SCHEMA
 from environment_detector import environment_detector
 
-@st.cache_data(show_spinner="Connecting to Databricks...")
-def load_data_from_databricks():
-    schema = st.session_state["METADATA"]["schema"]
-    
+# Small pool of warm Databricks SQL sessions; each fresh connect pays
+# TLS + auth + warehouse routing (typically 0.5-2s)
+_POOL_MAX = 4
+
+@st.cache_resource
+def _get_pool():
+    return queue.Queue(maxsize=_POOL_MAX)
+
+def _new_connection(params):
+    return sql.connect(
+        server_hostname=params["server_hostname"],
+        http_path=params["http_path"],
+        access_token=params["access_token"]
+    )
+
+@contextlib.contextmanager
+def get_conn(params):
+    """Borrow a pooled connection (creating one when the pool is empty) and
+    return it on exit; connections that raised are closed, not recycled."""
+    pool = _get_pool()
+    try:
+        connection = pool.get_nowait()
+    except queue.Empty:
+        connection = _new_connection(params)
+    try:
+        yield connection
+    except Exception:
+        try:
+            connection.close()
+        except Exception:
+            pass
+        raise
+    else:
+        try:
+            pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+# Rows per Arrow batch; bounds peak memory to roughly one batch on top of
+# the final frame instead of a monolithic fetch
+FETCH_BATCH_ROWS = 100_000
+
+def _build_query(schema, columns=None, table_filter=None):
+    """Build the validation-results query, pushing column projection and an
+    optional Table filter down to the warehouse instead of SELECT *."""
+    cols = ", ".join(f"`{c}`" for c in columns) if columns else "*"
+    query = f"SELECT {cols} FROM kdataai.{schema}.gx_validation_results_cleaned_combined"
+    params = []
+    if table_filter:
+        placeholders = ", ".join("?" for _ in table_filter)
+        query += f" WHERE `Table` IN ({placeholders})"
+        params = list(table_filter)
+    return query, params
+
+def _fetch_validation_results(connection, schema, columns=None, table_filter=None):
+    """Run the validation-results query and build the frame straight from
+    Arrow batches, skipping row-by-row DB-API conversion."""
+    query, params = _build_query(schema, columns, table_filter)
+    with connection.cursor() as cursor:
+        cursor.execute(query, params or None)
+        batches = []
+        while True:
+            batch = cursor.fetchmany_arrow(FETCH_BATCH_ROWS)
+            if batch.num_rows == 0:
+                break
+            batches.append(batch)
+
+    if not batches:
+        return pd.DataFrame()
+    return pa.concat_tables(batches).to_pandas(self_destruct=True)
+
+# cache_resource returns the same object on hit instead of re-pickling the
+# whole frame the way cache_data does; callers treat the frame as read-only
+# and copy before mutating (see app.py preprocessing)
+@st.cache_resource(show_spinner="Connecting to Databricks...")
+def load_data_from_databricks(schema, columns=None, table_filter=None):
     try:
         # Use environment detector for connection configuration
         connection_config = environment_detector.get_connection_config()
         
         if connection_config["use_automatic_auth"]:
             # Use Databricks runtime connection (automatic authentication)
-            import databricks.sql as databricks_sql
-            with databricks_sql.connect() as connection:
-                df = pd.read_sql(f"SELECT * FROM kdataai.{schema}.gx_validation_results_cleaned_combined", connection)
+            with sql.connect() as connection:
+                df = _fetch_validation_results(connection, schema, columns, table_filter)
         else:
             # Check if setup is required
             if connection_config.get("requires_setup", False):
@@ -37,18 +113,39 @@ def load_data_from_databricks():
                 st.error("❌ Missing Databricks connection parameters. Please run the setup wizard.")
                 return pd.DataFrame()
             
-            with sql.connect(
-                server_hostname=params["server_hostname"],
-                http_path=params["http_path"],
-                access_token=params["access_token"]
-            ) as connection:
-                df = pd.read_sql(f"SELECT * FROM kdataai.{schema}.gx_validation_results_cleaned_combined", connection)
+            with get_conn(params) as connection:
+                df = _fetch_validation_results(connection, schema, columns, table_filter)
         
         return df
     except Exception as e:
         _display_connection_error(e)
         return pd.DataFrame()
 
+def _fetch_distinct_tables(connection, schema):
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT DISTINCT `Table` FROM kdataai.{schema}.gx_validation_results_cleaned_combined")
+        return sorted(row[0] for row in cursor.fetchall() if row[0] is not None)
+
+@st.cache_data(show_spinner=False)
+def load_distinct_tables(schema):
+    """Fetch just the distinct table names for metadata discovery, avoiding
+    a full-table scan when only the Table column is needed."""
+    try:
+        connection_config = environment_detector.get_connection_config()
+
+        if connection_config["use_automatic_auth"]:
+            with sql.connect() as connection:
+                return _fetch_distinct_tables(connection, schema)
+
+        params = connection_config["connection_params"]
+        if not all([params.get("server_hostname"), params.get("http_path"), params.get("access_token")]):
+            return []
+
+        with get_conn(params) as connection:
+            return _fetch_distinct_tables(connection, schema)
+    except Exception:
+        return []
+
 def _display_connection_error(error):
     """Display helpful error messages based on the type of connection error"""
     error_str = str(error).lower()
@@ -76,6 +173,9 @@ def _display_connection_error(error):
     st.info("💡 **Need help?** Run the setup wizard to reconfigure your connection:")
     st.code("streamlit run setup_wizard.py")
 
+# Environment detection is invariant for the life of the process, so the
+# env-var probes and /databricks/* stat calls only run once
+@functools.cache
 def _is_running_in_databricks():
     """Check if the app is running in a Databricks environment"""
     # This function is kept for backwards compatibility
@@ -86,7 +186,12 @@ def initialize_metadata(df):
     if df.empty or 'Table' not in df.columns:
         return
     if not st.session_state["METADATA"]["tables"]:
-        discovered_tables = sorted(df['Table'].dropna().unique().tolist())
+        table_col = df['Table']
+        if isinstance(table_col.dtype, pd.CategoricalDtype):
+            # Read the O(k) category index instead of scanning all N rows
+            discovered_tables = table_col.cat.categories.dropna().sort_values().tolist()
+        else:
+            discovered_tables = sorted(table_col.dropna().unique().tolist())
         st.session_state["METADATA"]["tables"] = discovered_tables
         st.session_state["table_scope"] = {t: True for t in discovered_tables}
         st.rerun()
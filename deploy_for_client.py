@@ -14,15 +14,70 @@ Usage:
     python deploy_for_client.py --install          # Install dependencies only
 """
 
+import concurrent.futures
+import functools
 import os
 import sys
 import argparse
 import subprocess
 import json
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+
+# orjson parses in C and skips the str decode; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from typing import Dict, Any, Optional, Tuple
 import logging
 
+# Successful probes are remembered briefly so menu redraws and pre-start
+# checks don't each open a fresh warehouse session just to run SELECT 1
+_PROBE_TTL_SECONDS = 30
+_probe_cache: Dict[Tuple[str, str], float] = {}
+
+# pip package name -> importable module name
+_IMPORT_NAME_MAP = {
+    "databricks-sql-connector": "databricks.sql",
+    "python-dotenv": "dotenv",
+}
+
+@functools.cache
+def _dependencies_installed(packages: tuple) -> bool:
+    """Check package presence via the import finder without executing the
+    modules; cached because the menu redraws this on every loop."""
+    import importlib.util
+    for package in packages:
+        module_name = _IMPORT_NAME_MAP.get(package, package.replace("-", "_"))
+        if importlib.util.find_spec(module_name) is None:
+            return False
+    return True
+
+def _exec_streamlit(script: Path):
+    """Launch streamlit, replacing the current process on POSIX so the
+    deployer's interpreter isn't kept alive just to forward signals."""
+    argv = [sys.executable, "-m", "streamlit", "run", str(script)]
+    if os.name == "posix":
+        os.execv(sys.executable, argv)
+    subprocess.run(argv, check=True)
+
+@functools.cache
+def _load_env(path: str, mtime: float) -> Dict[str, str]:
+    """Parse a .env file once per (path, mtime) instead of re-reading it on
+    every menu action; an edited file changes mtime and misses the cache."""
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        return {}
+    return {key: value for key, value in dotenv_values(path).items() if value is not None}
+
+@functools.cache
+def _normalize_host(raw_host: str) -> str:
+    """Normalized Databricks host (scheme and trailing slash stripped),
+    computed once per distinct value instead of on every connection attempt."""
+    return raw_host.removeprefix("https://").removeprefix("http://").rstrip("/")
+
 class AutoDQClientDeployer:
     """Handles AutoDQ deployment for client environments"""
     
@@ -32,7 +87,11 @@ class AutoDQClientDeployer:
         self.config_file = self.project_root / "client_config.json"
         self.requirements_file = self.project_root / "requirements.txt"
         self.logger = self._setup_logging()
-        
+        # Seed the process environment from .env once; later reads go through
+        # _config_value so nothing re-parses the file per call
+        for key, value in self._env_values().items():
+            os.environ.setdefault(key, value)
+
     def _setup_logging(self):
         """Setup logging for deployment"""
         logging.basicConfig(
@@ -40,6 +99,17 @@ class AutoDQClientDeployer:
             format='%(asctime)s - %(levelname)s - %(message)s'
         )
         return logging.getLogger(__name__)
+
+    def _env_values(self) -> Dict[str, str]:
+        """Values from the .env file via the mtime-keyed parse cache"""
+        if not self.env_file.exists():
+            return {}
+        return _load_env(str(self.env_file), os.stat(self.env_file).st_mtime)
+
+    def _config_value(self, var: str, default: str = "") -> str:
+        """Config lookup: process environment wins over .env, matching
+        load_dotenv's no-override default"""
+        return os.environ.get(var) or self._env_values().get(var, default)
     
     def deploy(self, mode: str = "interactive") -> bool:
         """
@@ -80,36 +150,35 @@ class AutoDQClientDeployer:
         
         # Check current status
         self._display_current_status()
-        
+
+        # Labels and handlers live in one table so the printed menu and the
+        # dispatch can't drift; lookup replaces the if/elif chain
+        menu = {
+            "1": ("📦 Install dependencies", self._install_dependencies),
+            "2": ("⚙️  Run setup wizard", self._run_setup_wizard),
+            "3": ("🧪 Validate configuration", self._validate_configuration),
+            "4": ("🚀 Start AutoDQ", self._start_autodq),
+            "5": ("📋 View configuration", self._view_configuration),
+            "6": ("🔄 Reset configuration", self._reset_configuration),
+        }
+        menu_text = "\nWhat would you like to do?\n" + "\n".join(
+            f"{key}. {label}" for key, (label, _) in menu.items()
+        ) + "\n0. ❌ Exit"
+
         while True:
-            print("\nWhat would you like to do?")
-            print("1. 📦 Install dependencies")
-            print("2. ⚙️  Run setup wizard")
-            print("3. 🧪 Validate configuration")
-            print("4. 🚀 Start AutoDQ")
-            print("5. 📋 View configuration")
-            print("6. 🔄 Reset configuration")
-            print("0. ❌ Exit")
-            
+            print(menu_text)
+
             choice = input("\nEnter your choice (0-6): ").strip()
-            
+
             if choice == "0":
                 print("👋 Goodbye!")
                 return True
-            elif choice == "1":
-                self._install_dependencies()
-            elif choice == "2":
-                self._run_setup_wizard()
-            elif choice == "3":
-                self._validate_configuration()
-            elif choice == "4":
-                self._start_autodq()
-            elif choice == "5":
-                self._view_configuration()
-            elif choice == "6":
-                self._reset_configuration()
-            else:
+
+            entry = menu.get(choice)
+            if entry is None:
                 print("❌ Invalid choice. Please try again.")
+            else:
+                entry[1]()
     
     def _display_current_status(self):
         """Display current deployment status"""
@@ -123,24 +192,53 @@ class AutoDQClientDeployer:
         else:
             print(f"⚠️  Python {python_version.major}.{python_version.minor}.{python_version.micro} (3.8+ recommended)")
         
+        # The remaining checks are independent, and the connectivity probe is
+        # a full network round-trip — run them concurrently so the menu isn't
+        # blocked; anything not done within the timeout shows as pending
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        futures = {
+            "deps": executor.submit(self._check_dependencies),
+            "env_exists": executor.submit(self.env_file.exists),
+            "config_valid": executor.submit(self._is_configuration_valid),
+            "connected": executor.submit(self._can_connect_to_databricks),
+        }
+        executor.shutdown(wait=False)
+
+        def result_of(name, timeout=5):
+            try:
+                return futures[name].result(timeout=timeout)
+            except concurrent.futures.TimeoutError:
+                return None
+            except Exception:
+                return False
+
         # Check dependencies
-        if self._check_dependencies():
+        deps = result_of("deps")
+        if deps is None:
+            print("⏳ Dependency check still running")
+        elif deps:
             print("✅ Dependencies installed")
         else:
             print("❌ Dependencies missing")
-        
+
         # Check configuration
-        if self.env_file.exists():
+        if result_of("env_exists"):
             print("✅ Configuration file exists")
-            if self._is_configuration_valid():
+            config_valid = result_of("config_valid")
+            if config_valid is None:
+                print("⏳ Configuration check still running")
+            elif config_valid:
                 print("✅ Configuration appears valid")
             else:
                 print("⚠️  Configuration may be incomplete")
         else:
             print("❌ Configuration file missing")
-        
+
         # Check Databricks connectivity
-        if self._can_connect_to_databricks():
+        connected = result_of("connected")
+        if connected is None:
+            print("⏳ Databricks connection check still running")
+        elif connected:
             print("✅ Databricks connection working")
         else:
             print("❌ Cannot connect to Databricks")
@@ -153,20 +251,21 @@ class AutoDQClientDeployer:
         if not self.requirements_file.exists():
             self.logger.error("❌ requirements.txt not found")
             return False
-        
+
         try:
-            # Install main requirements
+            # Main requirements and client extras go through one pip process
+            # instead of two; skipping the self-update probe and input prompts
+            # shaves pip's cold start
             subprocess.run([
-                sys.executable, "-m", "pip", "install", "-r", str(self.requirements_file)
+                sys.executable, "-m", "pip", "install",
+                "--disable-pip-version-check", "--no-input",
+                "-r", str(self.requirements_file),
+                "python-dotenv", "streamlit"
             ], check=True)
-            
-            # Install additional client dependencies
-            client_deps = ["python-dotenv", "streamlit"]
-            subprocess.run([
-                sys.executable, "-m", "pip", "install"
-            ] + client_deps, check=True)
-            
+
             self.logger.info("✅ Dependencies installed successfully")
+            # New packages are now on disk; re-run the presence check next time
+            _dependencies_installed.cache_clear()
             return True
             
         except subprocess.CalledProcessError as e:
@@ -182,11 +281,9 @@ class AutoDQClientDeployer:
         if not wizard_file.exists():
             self.logger.error("❌ Setup wizard not found")
             return False
-        
+
         try:
-            subprocess.run([
-                sys.executable, "-m", "streamlit", "run", str(wizard_file)
-            ], check=True)
+            _exec_streamlit(wizard_file)
             return True
         except subprocess.CalledProcessError as e:
             self.logger.error(f"❌ Failed to run setup wizard: {e}")
@@ -204,60 +301,66 @@ class AutoDQClientDeployer:
             self.logger.error("❌ .env file not found. Run setup wizard first.")
             return False
         
-        # Load environment variables
-        try:
-            from dotenv import load_dotenv
-            load_dotenv(self.env_file)
-        except ImportError:
-            self.logger.warning("⚠️  python-dotenv not installed, using system environment")
-        
         # Check required variables
         required_vars = [
             "DATABRICKS_HOST",
-            "DATABRICKS_TOKEN", 
+            "DATABRICKS_TOKEN",
             "DATABRICKS_HTTP_PATH"
         ]
-        
-        missing_vars = []
-        for var in required_vars:
-            if not os.getenv(var):
-                missing_vars.append(var)
+
+        # Read each variable once instead of re-probing os.getenv per check
+        missing_vars = [var for var in required_vars if not self._config_value(var)]
         
         if missing_vars:
-            self.logger.error(f"❌ Missing required variables: {', '.join(missing_vars)}")
+            # Lazy %s formatting: the join/str work only happens if the
+            # record is actually emitted
+            self.logger.error("❌ Missing required variables: %s", missing_vars)
             return False
         
-        # Test Databricks connection
-        if self._test_databricks_connection():
+        # Test Databricks connection (explicit validation bypasses the probe cache)
+        if self._test_databricks_connection(force=True):
             self.logger.info("✅ Configuration valid and Databricks connection working")
             return True
         else:
             self.logger.error("❌ Configuration exists but Databricks connection failed")
             return False
     
-    def _test_databricks_connection(self) -> bool:
-        """Test connection to Databricks"""
-        
+    def _test_databricks_connection(self, force: bool = False) -> bool:
+        """Test connection to Databricks
+
+        A successful probe is cached for a short TTL; pass force=True to
+        bypass the cache (used by the explicit Validate action).
+        """
+
         try:
             from databricks import sql
-            
-            host = os.getenv("DATABRICKS_HOST", "").replace("https://", "")
-            token = os.getenv("DATABRICKS_TOKEN", "")
-            http_path = os.getenv("DATABRICKS_HTTP_PATH", "")
-            
+
+            host = _normalize_host(self._config_value("DATABRICKS_HOST"))
+            token = self._config_value("DATABRICKS_TOKEN")
+            http_path = self._config_value("DATABRICKS_HTTP_PATH")
+
             if not all([host, token, http_path]):
                 return False
-            
+
+            cache_key = (host, http_path)
+            if not force:
+                probed_at = _probe_cache.get(cache_key)
+                if probed_at is not None and time.monotonic() - probed_at < _PROBE_TTL_SECONDS:
+                    return True
+
             with sql.connect(
                 server_hostname=host,
                 http_path=http_path,
                 access_token=token
             ) as connection:
                 cursor = connection.cursor()
-                cursor.execute("SELECT 1 as test")
-                result = cursor.fetchone()
-                return result[0] == 1
-                
+                cursor.execute("SELECT 1")
+                connected = cursor.fetchone() is not None
+
+            if connected:
+                _probe_cache[cache_key] = time.monotonic()
+            return connected
+
         except Exception as e:
             self.logger.debug(f"Connection test failed: {e}")
             return False
@@ -275,11 +378,9 @@ class AutoDQClientDeployer:
         if not app_file.exists():
             self.logger.error("❌ app.py not found")
             return False
-        
+
         try:
-            subprocess.run([
-                sys.executable, "-m", "streamlit", "run", str(app_file)
-            ], check=True)
+            _exec_streamlit(app_file)
             return True
         except subprocess.CalledProcessError as e:
             self.logger.error(f"❌ Failed to start AutoDQ: {e}")
@@ -303,18 +404,20 @@ class AutoDQClientDeployer:
                 "DEFAULT_REFRESH_INTERVAL"
             ]
             
-            for var in env_vars:
-                value = os.getenv(var, "Not set")
-                if var == "DATABRICKS_TOKEN" and value != "Not set":
-                    value = "***" + value[-4:] if len(value) > 4 else "***"
-                print(f"{var}: {value}")
+            # Snapshot all values once and emit a single print so the
+            # display costs one stdout flush instead of one per variable
+            snapshot = {var: self._config_value(var) or "Not set" for var in env_vars}
+            token = snapshot["DATABRICKS_TOKEN"]
+            if token != "Not set":
+                snapshot["DATABRICKS_TOKEN"] = "***" + token[-4:] if len(token) > 4 else "***"
+            print("\n".join(f"{var}: {value}" for var, value in snapshot.items()))
         else:
             print("❌ No configuration file found")
         
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                raw = self.config_file.read_bytes()
+                config = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 print(f"\nClient Config:")
                 print(f"  Environment: {config.get('deployment_type', 'Unknown')}")
                 print(f"  Configured: {config.get('configured_at', 'Unknown')}")
@@ -346,35 +449,23 @@ class AutoDQClientDeployer:
     def _check_dependencies(self) -> bool:
         """Check if required dependencies are installed"""
         
-        required_packages = [
+        required_packages = (
             "streamlit",
-            "pandas", 
+            "pandas",
             "databricks-sql-connector",
             "python-dotenv"
-        ]
-        
-        for package in required_packages:
-            try:
-                __import__(package.replace("-", "_"))
-            except ImportError:
-                return False
-        
-        return True
+        )
+
+        return _dependencies_installed(required_packages)
     
     def _is_configuration_valid(self) -> bool:
         """Check if configuration is valid"""
         
         if not self.env_file.exists():
             return False
-        
-        try:
-            from dotenv import load_dotenv
-            load_dotenv(self.env_file)
-        except ImportError:
-            pass
-        
+
         required_vars = ["DATABRICKS_HOST", "DATABRICKS_TOKEN", "DATABRICKS_HTTP_PATH"]
-        return all(os.getenv(var) for var in required_vars)
+        return all(self._config_value(var) for var in required_vars)
     
     def _can_connect_to_databricks(self) -> bool:
         """Check if can connect to Databricks"""
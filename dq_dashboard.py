@@ -1,9 +1,64 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-import altair as alt
+import pyarrow as pa
 from config import RULE_CONFIG, DATABRICKS_HOST, DATABRICKS_TOKEN, DATABRICKS_HTTP_PATH
 from databricks import sql
+from utils import to_csv_bytes
 import os
+import time
+
+# Hand-written Vega-Lite specs: constructing charts through altair runs
+# schemapi validation and to_dict() on every rerun; the raw dicts skip both
+STATUS_PIE_SPEC = {
+    "mark": {"type": "arc"},
+    "encoding": {
+        "theta": {"field": "count", "type": "quantitative"},
+        "color": {
+            "field": "Status", "type": "nominal",
+            "scale": {"domain": ["Passed", "Failed"], "range": ["#2E8B57", "#DC143C"]},
+        },
+        "tooltip": [
+            {"field": "Status", "type": "nominal"},
+            {"field": "count", "type": "quantitative"},
+        ],
+    },
+    "width": 300,
+    "height": 300,
+}
+
+TREND_SPEC = {
+    "mark": {"type": "line", "point": True},
+    "encoding": {
+        "x": {"field": "date", "type": "temporal", "title": "Date"},
+        "y": {"field": "count", "type": "quantitative", "title": "Number of Checks"},
+        "color": {
+            "field": "Status", "type": "nominal",
+            "scale": {"domain": ["Passed", "Failed"], "range": ["#2E8B57", "#DC143C"]},
+        },
+        "tooltip": [
+            {"field": "date", "type": "temporal"},
+            {"field": "Status", "type": "nominal"},
+            {"field": "count", "type": "quantitative"},
+        ],
+    },
+    "width": 600,
+    "height": 300,
+}
+
+FAILED_BAR_SPEC = {
+    "mark": {"type": "bar", "color": "#DC143C"},
+    "encoding": {
+        "x": {"field": "count", "type": "quantitative", "title": "Number of Failed Checks"},
+        "y": {"field": "Table", "type": "nominal", "sort": "-x", "title": "Table"},
+        "tooltip": [
+            {"field": "Table", "type": "nominal"},
+            {"field": "count", "type": "quantitative"},
+        ],
+    },
+    "width": 600,
+    "height": 300,
+}
 
 # 🔧 Databricks Config from environment variables
 def get_databricks_connection_params():
@@ -17,25 +72,120 @@ def get_databricks_connection_params():
     
     return host, token, http_path
 
+# Process-wide Databricks session shared by the dashboard and tracker
+# fetches; every fresh sql.connect pays a TCP+TLS+auth handshake, so the
+# session lives across cache-miss fetches and is only dropped on error
+@st.cache_resource(show_spinner=False)
+def get_shared_connection():
+    host, token, http_path = get_databricks_connection_params()
+    return sql.connect(
+        server_hostname=host,
+        http_path=http_path,
+        access_token=token
+    )
+
+# Rows per Arrow batch; keeps peak memory to about one batch on top of the
+# final frame instead of holding a monolithic Arrow table during the fetch
+FETCH_BATCH_ROWS = 100_000
+
+def _read_sql_arrow(conn, query):
+    """Run a query and build the frame from the cursor's Arrow batches, which
+    skips the per-row Python tuple conversion pd.read_sql goes through"""
+    with conn.cursor() as cursor:
+        cursor.execute(query)
+        batches = []
+        while True:
+            batch = cursor.fetchmany_arrow(FETCH_BATCH_ROWS)
+            if batch.num_rows == 0:
+                break
+            batches.append(batch)
+
+    if not batches:
+        return pd.DataFrame()
+    return pa.concat_tables(batches).to_pandas(self_destruct=True)
+
+# Columns the dashboard consumes, listed explicitly so the two UNION ALL
+# branches are schema-aligned and unused columns never leave the warehouse
+_DASHBOARD_COLS = "`Run_Timestamp`, `Table`, `Column`, `Rule`, `Status`, `Metric`"
+
+_COMBINED_QUERY = f"""
+    SELECT {_DASHBOARD_COLS}
+    FROM multitable_logistics.gx_validation_results_cleaned_combined
+    WHERE Metric != 'User Generated Rule'
+    UNION ALL
+    SELECT {_DASHBOARD_COLS}
+    FROM multitable_logistics.user_defined_validation_log_final_for_dashboard
+"""
+
 # 📥 Fetch and merge both tables
 @st.cache_data(ttl=30)
 def fetch_combined_data():
     try:
-        host, token, http_path = get_databricks_connection_params()
-        
-        with sql.connect(
-            server_hostname=host,
-            http_path=http_path,
-            access_token=token
-        ) as conn:
-            df1 = pd.read_sql("SELECT * FROM multitable_logistics.gx_validation_results_cleaned_combined WHERE Metric != 'User Generated Rule'", conn)
-            df2 = pd.read_sql("SELECT * FROM multitable_logistics.user_defined_validation_log_final_for_dashboard", conn)
-        df = pd.concat([df1, df2], ignore_index=True)
-        return df
+        # One UNION ALL round-trip: Databricks merges the two sources into a
+        # single Arrow stream, so there's no second query and no concat copy
+        return _read_sql_arrow(get_shared_connection(), _COMBINED_QUERY)
     except Exception as e:
+        # Drop the cached session so the next run reconnects cleanly
+        get_shared_connection.clear()
         st.error(f"Failed to fetch data from Databricks: {e}")
         return pd.DataFrame()
 
+# Filter + aggregate work for one dashboard view. Cached on the filter
+# selections plus a cheap frame fingerprint (the frame itself is unhashed),
+# so reruns that change nothing — expander toggles, downloads — skip every scan
+@st.cache_data(ttl=30)
+def _compute_views(_df, fingerprint, tables, columns, metrics, rules, statuses, date_range):
+    # Apply filters with one preallocated mask, &='d in place, instead of
+    # holding five boolean temporaries and combining them at the end
+    mask = np.ones(len(_df), dtype=bool)
+    for col, selected in (
+        ("Table", tables),
+        ("Column", columns),
+        ("Metric", metrics),
+        ("Rule", rules),
+        ("Status", statuses),
+    ):
+        mask &= _df[col].isin(selected).to_numpy()
+
+    # Date range filter: compare raw datetime64 day values against the
+    # bounds rather than materializing a Python date object per row
+    if len(date_range) == 2:
+        start_date, end_date = date_range
+        ts_days = _df["Run_Timestamp"].to_numpy().astype("datetime64[D]")
+        mask &= (ts_days >= np.datetime64(start_date)) & (ts_days <= np.datetime64(end_date))
+
+    filtered_df = _df[mask]
+
+    # sort=False skips the ordering pass; categorical value_counts reports
+    # every category, so drop the zero rows the filters excluded
+    status_counts = filtered_df["Status"].value_counts(sort=False)
+    status_counts = status_counts[status_counts > 0]
+
+    if "Run_Timestamp" in filtered_df.columns:
+        # Group by day and status; floor("D") keeps the keys as datetime64
+        # (int64 epoch math) instead of a Python date object per row, and the
+        # result needs no to_datetime round-trip for Altair
+        daily_trends = filtered_df.groupby(
+            [filtered_df["Run_Timestamp"].dt.floor("D"), "Status"],
+            observed=True, sort=False
+        ).size().reset_index(name="count")
+        daily_trends.columns = ["date", "Status", "count"]
+    else:
+        daily_trends = pd.DataFrame(columns=["date", "Status", "count"])
+
+    # One Failed scan feeds both the bar chart and the failed-only export
+    failed_df = filtered_df[(filtered_df["Status"] == "Failed").to_numpy()]
+    failed_by_table = failed_df["Table"].value_counts()
+    failed_by_table = failed_by_table[failed_by_table > 0].head(10)
+
+    return {
+        "filtered": filtered_df,
+        "failed": failed_df,
+        "status_counts": status_counts,
+        "daily_trends": daily_trends,
+        "failed_by_table": failed_by_table,
+    }
+
 # 🚀 Main Renderer
 def render():
     st.subheader("Validation Dashboard")
@@ -51,13 +201,27 @@ def render():
         df["Run_Timestamp"] = pd.to_datetime(df["Run_Timestamp"], errors="coerce")
         df.dropna(subset=["Run_Timestamp"], inplace=True)
 
+    # Low-cardinality filter columns become categoricals once, so isin /
+    # value_counts / nunique below compare integer codes, not strings
+    for col in ("Table", "Column", "Metric", "Rule", "Status"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
+    # Remaining (higher-cardinality) text columns move to Arrow-backed
+    # strings: contiguous UTF-8 buffers instead of a Python str per cell
+    object_cols = df.select_dtypes("object").columns
+    if len(object_cols) > 0:
+        df[object_cols] = df[object_cols].astype("string[pyarrow]")
+
     # ------------------- FILTERS -------------------
     with st.expander("Filter Options", expanded=False):
-        available_tables = sorted(df["Table"].dropna().unique())
-        available_columns = sorted(df["Column"].dropna().unique())
-        available_metrics = sorted(df["Metric"].dropna().unique())
-        available_rules = sorted(df["Rule"].dropna().unique())
-        available_statuses = sorted(df["Status"].dropna().unique())
+        # The category index is already the sorted unique values, so the
+        # per-column sorted(unique()) scans go away
+        available_tables = df["Table"].cat.categories.tolist()
+        available_columns = df["Column"].cat.categories.tolist()
+        available_metrics = df["Metric"].cat.categories.tolist()
+        available_rules = df["Rule"].cat.categories.tolist()
+        available_statuses = df["Status"].cat.categories.tolist()
 
         c1, c2 = st.columns(2)
         with c1:
@@ -85,22 +249,15 @@ def render():
                 help="Select the date range for validation results"
             )
 
-    # Apply filters
-    filtered_df = df[
-        (df["Table"].isin(table_filter)) &
-        (df["Column"].isin(column_filter)) &
-        (df["Metric"].isin(metric_filter)) &
-        (df["Rule"].isin(rule_filter)) &
-        (df["Status"].isin(status_filter))
-    ]
-
-    # Date range filter
-    if len(date_range) == 2:
-        start_date, end_date = date_range
-        filtered_df = filtered_df[
-            (filtered_df["Run_Timestamp"].dt.date >= start_date) &
-            (filtered_df["Run_Timestamp"].dt.date <= end_date)
-        ]
+    # Filter and aggregate once per distinct view; the fingerprint stands in
+    # for hashing the whole frame
+    fingerprint = (len(df), df["Run_Timestamp"].max() if "Run_Timestamp" in df.columns else None)
+    views = _compute_views(
+        df, fingerprint,
+        tuple(table_filter), tuple(column_filter), tuple(metric_filter),
+        tuple(rule_filter), tuple(status_filter), tuple(date_range),
+    )
+    filtered_df = views["filtered"]
 
     if filtered_df.empty:
         st.warning("No data matches the selected filters.")
@@ -114,7 +271,7 @@ def render():
         st.metric("Total Validation Checks", total_checks)
     
     with col2:
-        failed_checks = len(filtered_df[filtered_df["Status"] == "Failed"])
+        failed_checks = int(views["status_counts"].get("Failed", 0))
         st.metric("Failed Checks", failed_checks)
     
     with col3:
@@ -129,24 +286,14 @@ def render():
     
     # Status Distribution
     st.subheader("📊 Validation Status Distribution")
-    status_counts = filtered_df["Status"].value_counts()
-    
+    status_counts = views["status_counts"]
+
     if not status_counts.empty:
         col1, col2 = st.columns([2, 1])
         
         with col1:
             # Pie chart for status distribution
-            chart = alt.Chart(status_counts.reset_index()).mark_arc().encode(
-                theta=alt.Theta(field="count", type="quantitative"),
-                color=alt.Color(field="Status", type="nominal", 
-                               scale=alt.Scale(domain=["Passed", "Failed"], 
-                                             range=["#2E8B57", "#DC143C"])),
-                tooltip=["Status", "count"]
-            ).properties(
-                width=300,
-                height=300
-            )
-            st.altair_chart(chart, use_container_width=True)
+            st.vega_lite_chart(status_counts.reset_index(), STATUS_PIE_SPEC, use_container_width=True)
         
         with col2:
             st.dataframe(status_counts, use_container_width=True)
@@ -154,47 +301,19 @@ def render():
     # Validation Trends Over Time
     if "Run_Timestamp" in filtered_df.columns:
         st.subheader("📈 Validation Trends Over Time")
-        
-        # Group by date and status
-        daily_trends = filtered_df.groupby([
-            filtered_df["Run_Timestamp"].dt.date,
-            "Status"
-        ]).size().reset_index(name="count")
-        daily_trends.columns = ["date", "Status", "count"]
-        
-        # Convert date column to datetime to avoid Altair dtype issues
-        daily_trends["date"] = pd.to_datetime(daily_trends["date"])
-        
+
+        daily_trends = views["daily_trends"]
+
         if not daily_trends.empty:
-            trend_chart = alt.Chart(daily_trends).mark_line(point=True).encode(
-                x=alt.X("date:T", title="Date"),
-                y=alt.Y("count:Q", title="Number of Checks"),
-                color=alt.Color("Status:N", 
-                               scale=alt.Scale(domain=["Passed", "Failed"], 
-                                             range=["#2E8B57", "#DC143C"])),
-                tooltip=["date", "Status", "count"]
-            ).properties(
-                width=600,
-                height=300
-            )
-            st.altair_chart(trend_chart, use_container_width=True)
+            st.vega_lite_chart(daily_trends, TREND_SPEC, use_container_width=True)
 
     # Failed Checks by Table
     if failed_checks > 0:
         st.subheader("🚨 Failed Checks by Table")
-        failed_by_table = filtered_df[filtered_df["Status"] == "Failed"]["Table"].value_counts().head(10)
-        
+        failed_by_table = views["failed_by_table"]
+
         if not failed_by_table.empty:
-            failed_chart = alt.Chart(failed_by_table.reset_index()).mark_bar().encode(
-                x=alt.X("count:Q", title="Number of Failed Checks"),
-                y=alt.Y("Table:N", sort="-x", title="Table"),
-                color=alt.value("#DC143C"),
-                tooltip=["Table", "count"]
-            ).properties(
-                width=600,
-                height=300
-            )
-            st.altair_chart(failed_chart, use_container_width=True)
+            st.vega_lite_chart(failed_by_table.reset_index(), FAILED_BAR_SPEC, use_container_width=True)
 
     # ------------------- DETAILED VIEW -------------------
     st.subheader("🔍 Detailed Validation Results")
@@ -204,8 +323,14 @@ def render():
     available_display_columns = [col for col in display_columns if col in filtered_df.columns]
     
     if available_display_columns:
+        # nlargest keeps the view to the newest 1000 rows with an O(N log K)
+        # partial sort instead of fully ordering the filtered frame
+        if "Run_Timestamp" in available_display_columns:
+            detailed_view = filtered_df[available_display_columns].nlargest(1000, "Run_Timestamp")
+        else:
+            detailed_view = filtered_df[available_display_columns]
         st.dataframe(
-            filtered_df[available_display_columns].sort_values("Run_Timestamp", ascending=False),
+            detailed_view,
             use_container_width=True,
             height=400
         )
@@ -215,24 +340,30 @@ def render():
     # ------------------- EXPORT OPTIONS -------------------
     if not filtered_df.empty:
         st.subheader("📤 Export Data")
-        
+
+        # One strftime for both filenames; time.strftime stays in C instead
+        # of building a pandas Timestamp per button
+        run_ts = time.strftime('%Y%m%d_%H%M%S')
+
         col1, col2 = st.columns(2)
         
         with col1:
-            csv = filtered_df.to_csv(index=False)
+            # Cached bytes serialization: reruns with the same view reuse the
+            # encoded CSV instead of rebuilding a frame-sized string
+            csv = to_csv_bytes(filtered_df)
             st.download_button(
                 label="Download as CSV",
                 data=csv,
-                file_name=f"validation_results_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                file_name=f"validation_results_{run_ts}.csv",
                 mime="text/csv"
             )
         
         with col2:
             if failed_checks > 0:
-                failed_csv = filtered_df[filtered_df["Status"] == "Failed"].to_csv(index=False)
+                failed_csv = to_csv_bytes(views["failed"])
                 st.download_button(
                     label="Download Failed Checks Only",
                     data=failed_csv,
-                    file_name=f"failed_validations_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    file_name=f"failed_validations_{run_ts}.csv",
                     mime="text/csv"
                 )
@@ -1,8 +1,13 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from config import DQ_STATUS_OPTIONS, DATABRICKS_HOST, DATABRICKS_TOKEN, DATABRICKS_HTTP_PATH
 from databricks import sql
+from dq_dashboard import get_shared_connection
+from utils import to_csv_bytes
 import os
+import time
 
 # ----------------------------------------
 # 🔧 Databricks Config from Environment Variables
@@ -40,33 +45,44 @@ def ensure_all_tracker_cols(df):
 def fetch_failed_records():
     """Fetch failed validation records from Databricks"""
     try:
-        host, token, http_path = get_databricks_connection_params()
-        
-        with sql.connect(
-            server_hostname=host,
-            http_path=http_path,
-            access_token=token
-        ) as connection:
-            query = """
-                SELECT 
-                    Table, Column, Rule_Display_Name, CAST(Failed_Row_ID AS STRING) as Failed_Row_ID, CAST(Failed_Value AS STRING) as Failed_Value
-                FROM multitable_logistics.gx_validation_results_cleaned_combined
-                WHERE Status = 'Failed'
-                
-                UNION
-                
-                SELECT 
-                    Table, Column, Rule_Display_Name, CAST(Failed_Row_ID AS STRING) as Failed_Row_ID, CAST(Failed_Value AS STRING) as Failed_Value
-                FROM multitable_logistics.user_defined_validation_log_final_for_dashboard
-                WHERE Status = 'Failed'
-            """
-            df = pd.read_sql(query, connection)
-            
-            # Additional deduplication at DataFrame level as safeguard
-            df = df.drop_duplicates(subset=['Table', 'Column', 'Rule_Display_Name', 'Failed_Row_ID'], keep='first')
-            
-            return df
+        connection = get_shared_connection()
+        query = """
+            SELECT
+                Table, Column, Rule_Display_Name, CAST(Failed_Row_ID AS STRING) as Failed_Row_ID, CAST(Failed_Value AS STRING) as Failed_Value
+            FROM multitable_logistics.gx_validation_results_cleaned_combined
+            WHERE Status = 'Failed'
+
+            UNION
+
+            SELECT
+                Table, Column, Rule_Display_Name, CAST(Failed_Row_ID AS STRING) as Failed_Row_ID, CAST(Failed_Value AS STRING) as Failed_Value
+            FROM multitable_logistics.user_defined_validation_log_final_for_dashboard
+            WHERE Status = 'Failed'
+        """
+        # Arrow batch fetch avoids row-by-row DB-API conversion and bounds
+        # peak memory to one batch; UNION (not UNION ALL) already dedupes
+        with connection.cursor() as cursor:
+            cursor.execute(query)
+            batches = []
+            while True:
+                batch = cursor.fetchmany_arrow(100_000)
+                if batch.num_rows == 0:
+                    break
+                batches.append(batch)
+
+        if not batches:
+            return pd.DataFrame()
+        df = pa.concat_tables(batches).to_pandas(self_destruct=True)
+
+        # Keep the text columns (including high-cardinality Failed_Row_ID /
+        # Failed_Value) as Arrow-backed strings rather than object dtype
+        object_cols = df.select_dtypes("object").columns
+        if len(object_cols) > 0:
+            df[object_cols] = df[object_cols].astype("string[pyarrow]")
+        return df
     except Exception as e:
+        # Drop the cached session so the next run reconnects cleanly
+        get_shared_connection.clear()
         st.error(f"❌ Failed to fetch failed records: {e}")
         return pd.DataFrame()
 
@@ -137,23 +153,18 @@ def render():
                     
                     # Merge with existing tracker data (avoid duplicates)
                     if not st.session_state.action_tracker.empty:
-                        # Create a unique key for deduplication
-                        existing_keys = (
-                            st.session_state.action_tracker["Table"].astype(str) + "|" +
-                            st.session_state.action_tracker["Column"].astype(str) + "|" +
-                            st.session_state.action_tracker["Rule_Display_Name"].astype(str) + "|" +
-                            st.session_state.action_tracker["Failed_Row_ID"].astype(str)
-                        )
-                        
-                        new_keys = (
-                            failed_df["Table"].astype(str) + "|" +
-                            failed_df["Column"].astype(str) + "|" +
-                            failed_df["Rule_Display_Name"].astype(str) + "|" +
-                            failed_df["Failed_Row_ID"].astype(str)
-                        )
-                        
+                        # Hash the four key columns per row for deduplication
+                        # instead of building "a|b|c|d" strings on both sides
+                        key_cols = ["Table", "Column", "Rule_Display_Name", "Failed_Row_ID"]
+                        existing_keys = pd.util.hash_pandas_object(
+                            st.session_state.action_tracker[key_cols], index=False
+                        ).to_numpy()
+                        new_keys = pd.util.hash_pandas_object(
+                            failed_df[key_cols], index=False
+                        ).to_numpy()
+
                         # Only add new records
-                        new_records = failed_df[~new_keys.isin(existing_keys)]
+                        new_records = failed_df[~np.isin(new_keys, existing_keys)]
                         
                         if not new_records.empty:
                             st.session_state.action_tracker = pd.concat(
@@ -184,27 +195,32 @@ def render():
     # 🔍 Filters
     # ----------------------------------------
     with st.expander("🔍 Filter Options", expanded=False):
+        # Sort each filter domain once per rerun; the old code re-ran the
+        # dropna/unique/sort scan twice per widget for options and default
+        table_options = sorted(st.session_state.action_tracker["Table"].dropna().unique())
+        assignee_options = sorted(st.session_state.action_tracker["Assignee"].dropna().unique())
+
         col1, col2, col3 = st.columns(3)
-        
+
         with col1:
             status_filter = st.multiselect(
                 "Filter by Status",
                 options=DQ_STATUS_OPTIONS,
                 default=DQ_STATUS_OPTIONS
             )
-        
+
         with col2:
             table_filter = st.multiselect(
                 "Filter by Table",
-                options=sorted(st.session_state.action_tracker["Table"].dropna().unique()),
-                default=sorted(st.session_state.action_tracker["Table"].dropna().unique())
+                options=table_options,
+                default=table_options
             )
-        
+
         with col3:
             assignee_filter = st.multiselect(
                 "Filter by Assignee",
-                options=sorted(st.session_state.action_tracker["Assignee"].dropna().unique()),
-                default=sorted(st.session_state.action_tracker["Assignee"].dropna().unique())
+                options=assignee_options,
+                default=assignee_options
             )
 
     # Apply filters
@@ -242,11 +258,11 @@ def render():
         bulk_status = st.selectbox("Set Status", options=DQ_STATUS_OPTIONS, key="bulk_status")
     
     with col2:
-        # Get existing assignees from the tracker
-        existing_assignees = sorted([a for a in st.session_state.action_tracker["Assignee"].dropna().unique() if a.strip() != ""])
-        assignee_options = [""] + existing_assignees + ["+ Add New Assignee"]
-        
-        bulk_assignee_selection = st.selectbox("Assign To", options=assignee_options, key="bulk_assignee_selection")
+        # Reuse the sorted assignee domain computed for the filters
+        existing_assignees = [a for a in assignee_options if a.strip() != ""]
+        bulk_assignee_options = [""] + existing_assignees + ["+ Add New Assignee"]
+
+        bulk_assignee_selection = st.selectbox("Assign To", options=bulk_assignee_options, key="bulk_assignee_selection")
         
         # If user selects "Add New Assignee", show text input
         if bulk_assignee_selection == "+ Add New Assignee":
@@ -269,10 +285,14 @@ def render():
     
     with col4:
         if st.button("🗑️ Clear Resolved"):
-            resolved_mask = st.session_state.action_tracker["Action_Status"] == "Resolved"
-            removed_count = resolved_mask.sum()
-            st.session_state.action_tracker = st.session_state.action_tracker[~resolved_mask]
-            
+            # Drop in place by index instead of copying every kept row into
+            # a negated-mask slice
+            resolved_idx = st.session_state.action_tracker.index[
+                st.session_state.action_tracker["Action_Status"].eq("Resolved")
+            ]
+            removed_count = len(resolved_idx)
+            st.session_state.action_tracker.drop(resolved_idx, inplace=True)
+
             if removed_count > 0:
                 st.success(f"✅ Removed {removed_count} resolved issues")
                 st.rerun()
@@ -317,16 +337,12 @@ def render():
             key="action_tracker_editor"
         )
         
-        # Update session state with edits
-        if not edited_df.equals(filtered_df):
-            # Update the main dataframe with changes - properly map indices
-            for idx in edited_df.index:
-                if idx in st.session_state.action_tracker.index:
-                    # Update only the editable columns
-                    editable_cols = ["Action_Status", "Assignee", "Notes"]
-                    for col in editable_cols:
-                        if col in edited_df.columns:
-                            st.session_state.action_tracker.loc[idx, col] = edited_df.loc[idx, col]
+        # Update session state with edits; compare and assign only the
+        # editable columns in one label-aligned bulk .loc instead of a
+        # scalar setter call per row and column
+        editable_cols = ["Action_Status", "Assignee", "Notes"]
+        if not edited_df[editable_cols].equals(filtered_df[editable_cols]):
+            st.session_state.action_tracker.loc[edited_df.index, editable_cols] = edited_df[editable_cols]
             st.rerun()
 
     else:
@@ -337,41 +353,48 @@ def render():
     # ----------------------------------------
     st.markdown("---")
     st.markdown("### 📤 Export & Reporting")
-    
+
+    # One strftime shared by every export filename in this rerun
+    run_ts = time.strftime('%Y%m%d_%H%M%S')
+
     col1, col2, col3 = st.columns(3)
     
     with col1:
         if not st.session_state.action_tracker.empty:
-            csv_data = st.session_state.action_tracker.to_csv(index=False)
+            csv_data = to_csv_bytes(st.session_state.action_tracker)
             st.download_button(
                 label="📊 Export All Issues",
                 data=csv_data,
-                file_name=f"dq_action_tracker_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                file_name=f"dq_action_tracker_{run_ts}.csv",
                 mime="text/csv"
             )
     
     with col2:
         if not filtered_df.empty:
-            filtered_csv = filtered_df.to_csv(index=False)
+            filtered_csv = to_csv_bytes(filtered_df)
             st.download_button(
                 label="🔍 Export Filtered",
                 data=filtered_csv,
-                file_name=f"dq_tracker_filtered_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                file_name=f"dq_tracker_filtered_{run_ts}.csv",
                 mime="text/csv"
             )
     
     with col3:
         if st.button("📊 Generate Summary Report"):
             if not st.session_state.action_tracker.empty:
-                # Create summary report
+                # Create summary report: one value_counts pass replaces the
+                # three per-status length scans, one nunique covers both keys
+                tracker_df = st.session_state.action_tracker
+                status_counts = tracker_df["Action_Status"].value_counts()
+                unique_counts = tracker_df[["Table", "Rule_Display_Name"]].nunique()
                 summary_data = {
-                    "Total Issues": [len(st.session_state.action_tracker)],
-                    "Open Issues": [len(st.session_state.action_tracker[st.session_state.action_tracker["Action_Status"] == "Open"])],
-                    "In Progress": [len(st.session_state.action_tracker[st.session_state.action_tracker["Action_Status"] == "In Progress"])],
-                    "Resolved Issues": [len(st.session_state.action_tracker[st.session_state.action_tracker["Action_Status"] == "Resolved"])],
-                    "Unique Tables": [st.session_state.action_tracker["Table"].nunique()],
-                    "Unique Rules": [st.session_state.action_tracker["Rule_Display_Name"].nunique()],
-                    "Report Date": [pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')]
+                    "Total Issues": [len(tracker_df)],
+                    "Open Issues": [int(status_counts.get("Open", 0))],
+                    "In Progress": [int(status_counts.get("In Progress", 0))],
+                    "Resolved Issues": [int(status_counts.get("Resolved", 0))],
+                    "Unique Tables": [int(unique_counts["Table"])],
+                    "Unique Rules": [int(unique_counts["Rule_Display_Name"])],
+                    "Report Date": [time.strftime('%Y-%m-%d %H:%M:%S')]
                 }
                 
                 summary_df = pd.DataFrame(summary_data)
@@ -380,7 +403,7 @@ def render():
                 st.download_button(
                     label="💾 Download Summary",
                     data=summary_csv,
-                    file_name=f"dq_summary_report_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    file_name=f"dq_summary_report_{run_ts}.csv",
                     mime="text/csv"
                 )
 
@@ -7,27 +7,91 @@ from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 import logging
 
+# orjson parses and serializes bytes directly, skipping the text decode the
+# stdlib path pays; optional, so fall back to json when it is not installed
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# Every environment variable the detector reads; snapshotted in one pass so
+# repeated probes don't each go back to os.environ
+_ENV_KEYS = (
+    "DATABRICKS_RUNTIME_VERSION", "DATABRICKS_WORKSPACE_URL", "DATABRICKS_WORKSPACE_ID",
+    "DATABRICKS_CLUSTER_ID", "DATABRICKS_APP_ID", "DATABRICKS_APP_NAME",
+    "LAKEHOUSE_APP_MODE", "DATABRICKS_APP_PORT", "DATABRICKS_HOST",
+    "DATABRICKS_TOKEN", "DATABRICKS_HTTP_PATH", "DEFAULT_SCHEMA",
+    "DEFAULT_REFRESH_INTERVAL", "DATABRICKS_SSL_VERIFY", "DATABRICKS_CATALOG",
+    "UNITY_CATALOG_ENABLED", "DATABRICKS_JOB_ID", "DATABRICKS_SECRETS_SCOPE",
+)
+
+# Fixed key groups the probes iterate over, hoisted so detection never
+# rebuilds per-call lists
+_DBR_ENV_KEYS = (
+    "DATABRICKS_RUNTIME_VERSION", "DATABRICKS_WORKSPACE_URL", "DATABRICKS_WORKSPACE_ID",
+)
+_LAKEHOUSE_KEYS = ("DATABRICKS_APP_ID", "DATABRICKS_APP_NAME", "LAKEHOUSE_APP_MODE")
+_CLIENT_ENV_KEYS = (
+    "DATABRICKS_HOST", "DATABRICKS_TOKEN", "DATABRICKS_HTTP_PATH",
+    "DEFAULT_SCHEMA", "DEFAULT_REFRESH_INTERVAL", "DATABRICKS_SSL_VERIFY",
+)
+
+def mask_token(token: Optional[str]) -> Optional[str]:
+    """Mask a token down to its last four characters for display"""
+    return ("***" + token[-4:]) if token else None
+
 class EnvironmentDetector:
     """Detects and manages different deployment environments for AutoDQ"""
-    
+
     def __init__(self):
         self.config_file = Path("client_config.json")
         self.env_file = Path(".env")
         self.logger = self._setup_logging()
-        
+        self._env_cache: Optional[Dict[str, Optional[str]]] = None
+        self._env_config_cache: Optional[Dict[str, Any]] = None
+
     def _setup_logging(self):
         """Setup logging for environment detection"""
         logging.basicConfig(level=logging.INFO)
         return logging.getLogger(__name__)
     
+    def _env(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Read environment variables from a lazily built snapshot"""
+        if self._env_cache is None:
+            self._env_cache = {k: os.environ.get(k) for k in _ENV_KEYS}
+        value = self._env_cache.get(key)
+        return default if value is None else value
+
+    def invalidate(self) -> None:
+        """Drop the cached detection result and env snapshot so the next
+        detect_environment() re-probes from scratch"""
+        self._env_cache = None
+        self._env_config_cache = None
+
     def detect_environment(self) -> Dict[str, Any]:
         """
         Detect the current deployment environment and return configuration
-        
+
+        The result is computed once per instance; the probes (env vars,
+        /databricks/* stats, config-file parse) cannot change mid-process,
+        so callers share the cached dict. Use invalidate() to force a rerun.
+
         Returns:
             Dict containing environment type and configuration details
         """
-        
+        if self._env_config_cache is None:
+            self._env_config_cache = self._detect_once()
+        return self._env_config_cache
+
+    def _detect_once(self) -> Dict[str, Any]:
         # Check for Databricks runtime environment
         if self._is_databricks_runtime():
             return self._get_databricks_runtime_config()
@@ -45,29 +109,26 @@ class EnvironmentDetector:
     
     def _is_databricks_runtime(self) -> bool:
         """Check if running in Databricks runtime environment"""
-        indicators = [
-            os.getenv("DATABRICKS_RUNTIME_VERSION"),
-            os.getenv("DATABRICKS_WORKSPACE_URL"), 
-            os.getenv("DATABRICKS_WORKSPACE_ID"),
-            os.path.exists("/databricks/driver"),
-            os.path.exists("/databricks/spark")
-        ]
-        
-        is_databricks = any(indicators)
+        # Cheapest checks first with real short-circuiting: the env vars
+        # settle the common cases without paying for the filesystem stats
+        is_databricks = any(self._env(k) for k in _DBR_ENV_KEYS)
+        if not is_databricks:
+            for path in ("/databricks/driver", "/databricks/spark"):
+                try:
+                    os.stat(path)
+                    is_databricks = True
+                    break
+                except OSError:
+                    continue
+
         if is_databricks:
             self.logger.info("Detected Databricks runtime environment")
-        
+
         return is_databricks
     
     def _is_databricks_lakehouse_app(self) -> bool:
         """Check if running as a Databricks Lakehouse App"""
-        lakehouse_indicators = [
-            os.getenv("DATABRICKS_APP_ID"),
-            os.getenv("DATABRICKS_APP_NAME"),
-            os.getenv("LAKEHOUSE_APP_MODE")
-        ]
-        
-        is_lakehouse = any(lakehouse_indicators)
+        is_lakehouse = any(self._env(k) for k in _LAKEHOUSE_KEYS)
         if is_lakehouse:
             self.logger.info("Detected Databricks Lakehouse App environment")
             
@@ -84,11 +145,11 @@ class EnvironmentDetector:
             "requires_setup": False,
             "auto_authentication": True,
             "connection_method": "databricks_sql_connect",
-            "workspace_url": os.getenv("DATABRICKS_WORKSPACE_URL"),
-            "workspace_id": os.getenv("DATABRICKS_WORKSPACE_ID"),
-            "runtime_version": os.getenv("DATABRICKS_RUNTIME_VERSION"),
-            "cluster_id": os.getenv("DATABRICKS_CLUSTER_ID"),
-            "default_schema": os.getenv("DEFAULT_SCHEMA", "multitable_logistics"),
+            "workspace_url": self._env("DATABRICKS_WORKSPACE_URL"),
+            "workspace_id": self._env("DATABRICKS_WORKSPACE_ID"),
+            "runtime_version": self._env("DATABRICKS_RUNTIME_VERSION"),
+            "cluster_id": self._env("DATABRICKS_CLUSTER_ID"),
+            "default_schema": self._env("DEFAULT_SCHEMA", "multitable_logistics"),
             "detected_features": self._get_databricks_features()
         }
     
@@ -99,11 +160,11 @@ class EnvironmentDetector:
             "requires_setup": False,
             "auto_authentication": True,
             "connection_method": "lakehouse_app_connect",
-            "app_id": os.getenv("DATABRICKS_APP_ID"),
-            "app_name": os.getenv("DATABRICKS_APP_NAME"),
-            "workspace_url": os.getenv("DATABRICKS_WORKSPACE_URL"),
-            "default_schema": os.getenv("DEFAULT_SCHEMA", "multitable_logistics"),
-            "app_port": os.getenv("DATABRICKS_APP_PORT", "8501")
+            "app_id": self._env("DATABRICKS_APP_ID"),
+            "app_name": self._env("DATABRICKS_APP_NAME"),
+            "workspace_url": self._env("DATABRICKS_WORKSPACE_URL"),
+            "default_schema": self._env("DEFAULT_SCHEMA", "multitable_logistics"),
+            "app_port": self._env("DATABRICKS_APP_PORT", "8501")
         }
     
     def _get_client_config(self) -> Dict[str, Any]:
@@ -113,21 +174,22 @@ class EnvironmentDetector:
         client_metadata = {}
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    client_metadata = json.load(f)
+                client_metadata = _loads(self.config_file.read_bytes())
             except Exception as e:
                 self.logger.warning(f"Could not load client config: {e}")
         
-        # Check environment variables
+        # Cheap required-var check first; only build the full env dict once
+        # we know we are on the client_configured path
+        missing = self._missing_required()
         env_config = self._load_env_config()
-        
+
         return {
             "environment_type": "client_configured",
-            "requires_setup": not self._is_fully_configured(env_config),
+            "requires_setup": missing is not None,
             "auto_authentication": False,
             "connection_method": "manual_credentials",
             "databricks_host": env_config.get("DATABRICKS_HOST"),
-            "databricks_token": "***" + env_config.get("DATABRICKS_TOKEN", "")[-4:] if env_config.get("DATABRICKS_TOKEN") else None,
+            "databricks_token": mask_token(env_config.get("DATABRICKS_TOKEN")),
             "databricks_http_path": env_config.get("DATABRICKS_HTTP_PATH"),
             "default_schema": env_config.get("DEFAULT_SCHEMA", "multitable_logistics"),
             "refresh_interval": env_config.get("DEFAULT_REFRESH_INTERVAL", "10"),
@@ -155,21 +217,14 @@ class EnvironmentDetector:
     
     def _load_env_config(self) -> Dict[str, str]:
         """Load configuration from environment variables"""
-        env_vars = [
-            "DATABRICKS_HOST",
-            "DATABRICKS_TOKEN", 
-            "DATABRICKS_HTTP_PATH",
-            "DEFAULT_SCHEMA",
-            "DEFAULT_REFRESH_INTERVAL",
-            "DATABRICKS_SSL_VERIFY"
-        ]
-        
-        return {var: os.getenv(var, "") for var in env_vars}
+        return {var: self._env(var, "") for var in _CLIENT_ENV_KEYS}
     
-    def _is_fully_configured(self, env_config: Dict[str, str]) -> bool:
-        """Check if environment is fully configured"""
-        required_vars = ["DATABRICKS_HOST", "DATABRICKS_TOKEN", "DATABRICKS_HTTP_PATH"]
-        return all(env_config.get(var) for var in required_vars)
+    def _missing_required(self) -> Optional[str]:
+        """Return the first missing required variable, or None if complete"""
+        for key in ("DATABRICKS_HOST", "DATABRICKS_TOKEN", "DATABRICKS_HTTP_PATH"):
+            if not self._env(key):
+                return key
+        return None
     
     def _get_databricks_features(self) -> Dict[str, bool]:
         """Detect available Databricks features"""
@@ -184,7 +239,7 @@ class EnvironmentDetector:
         """Check if Unity Catalog is available"""
         try:
             # Check for Unity Catalog environment variables
-            return bool(os.getenv("DATABRICKS_CATALOG") or os.getenv("UNITY_CATALOG_ENABLED"))
+            return bool(self._env("DATABRICKS_CATALOG") or self._env("UNITY_CATALOG_ENABLED"))
         except:
             return False
     
@@ -195,13 +250,13 @@ class EnvironmentDetector:
     
     def _has_jobs_api(self) -> bool:
         """Check if Jobs API is available"""
-        return bool(os.getenv("DATABRICKS_JOB_ID"))
+        return bool(self._env("DATABRICKS_JOB_ID"))
     
     def _has_secrets_scope(self) -> bool:
         """Check if Databricks Secrets are available"""
         try:
             # Check for secrets-related environment variables
-            return bool(os.getenv("DATABRICKS_SECRETS_SCOPE"))
+            return bool(self._env("DATABRICKS_SECRETS_SCOPE"))
         except:
             return False
     
@@ -235,8 +290,7 @@ class EnvironmentDetector:
     def save_client_config(self, config: Dict[str, Any]) -> bool:
         """Save client configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            self.config_file.write_bytes(_dumps(config))
             return True
         except Exception as e:
             self.logger.error(f"Failed to save client config: {e}")
@@ -1,9 +1,21 @@
 import streamlit as st
 import base64
+from pathlib import Path
 
 @st.cache_data
 def get_architecture_diagram(path):
-    """Load and encode architecture diagram with caching"""
+    """Load architecture diagram with caching
+
+    Prefers the pre-encoded sidecar (base64 -w0 Background.png >
+    Background.png.b64, generated at build) so cold renders skip the
+    read-and-encode pass over the ~2 MB PNG; falls back to encoding the
+    PNG when the sidecar is missing.
+    """
+    sidecar = Path(f"{path}.b64")
+    try:
+        return sidecar.read_text()
+    except OSError:
+        pass
     try:
         with open(path, "rb") as image_file:
             return base64.b64encode(image_file.read()).decode()
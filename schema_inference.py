@@ -1,16 +1,33 @@
-import streamlit as st
-import pandas as pd
-
-def render(df):
-    st.subheader("Schema Inference")
-
-    schema = pd.DataFrame({
-        "Column": df.columns,
-        "Data Type": [str(dt) for dt in df.dtypes.values],
-        "Nulls": df.isnull().sum().values,
-        "Null %": (df.isnull().mean() * 100).round(2),
-        "Uniques": df.nunique().values
-    })
-
-    st.dataframe(schema, use_container_width=True)
-    st.download_button("⬇ Download Schema", schema.to_csv(index=False), "schema.csv")
+import streamlit as st
+import pandas as pd
+from utils import to_csv_bytes
+
+# Cached on a cheap fingerprint (the frame itself is unhashed) so widget
+# reruns between data refreshes skip the per-column scans entirely
+@st.cache_data
+def _build_schema(_df, fingerprint):
+    """One pass per column: reuse the null mask for count and percentage
+    instead of materializing isnull() twice plus a separate nunique frame."""
+    df = _df
+    n = len(df)
+    rows = []
+    for col in df.columns:
+        s = df[col]
+        nulls = int(s.isna().sum())
+        rows.append((
+            col,
+            str(s.dtype),
+            nulls,
+            round(nulls * 100.0 / n, 2) if n else 0.0,
+            s.nunique(dropna=True),
+        ))
+    return pd.DataFrame(rows, columns=["Column", "Data Type", "Nulls", "Null %", "Uniques"])
+
+def render(df):
+    st.subheader("Schema Inference")
+
+    fingerprint = (len(df), tuple(df.columns), st.session_state.get("last_refresh"))
+    schema = _build_schema(df, fingerprint)
+
+    st.dataframe(schema, use_container_width=True)
+    st.download_button("⬇ Download Schema", to_csv_bytes(schema), "schema.csv")
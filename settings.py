@@ -1,11 +1,13 @@
 import streamlit as st
+import json
 from datetime import datetime
 from config import DQ_STATUS_OPTIONS, DATABRICKS_HOST, DATABRICKS_TOKEN, DATABRICKS_HTTP_PATH
+from environment_detector import mask_token
 import os
 
-from databricks import sql
-import requests
-import pandas as pd
+# databricks.sql, requests and pandas are imported inside the functions that
+# need them: this page is one of many in the app, and keeping its heavy
+# dependencies off the module-import path trims cold start for the others
 
 # ---- Databricks Config from Environment Variables ----
 def get_databricks_connection_params():
@@ -25,10 +27,15 @@ VALIDATION_TABLE = "gx_validation_results_cleaned_combined"
 RULE_METADATA_TABLE = "silver_layer_rule_metadata_DQ"
 
 # ---- Connection Helper ----
+# One long-lived session per process: every helper on this page used to open
+# (and close) its own connection, paying the TCP+TLS+auth handshake each time
+@st.cache_resource(show_spinner=False)
 def get_databricks_connection():
-    """Get a Databricks SQL connection"""
+    """Get the shared Databricks SQL connection"""
+    from databricks import sql
+
     host, token, http_path, _ = get_databricks_connection_params()
-    
+
     return sql.connect(
         server_hostname=host.replace("https://", ""),
         http_path=http_path,
@@ -36,69 +43,103 @@ def get_databricks_connection():
     )
 
 # ---- Metadata Fetchers ----
+@st.cache_data(ttl=600)
 def fetch_generated_results():
     """Fetch validation results from Databricks"""
+    import pandas as pd
+
     try:
         conn = get_databricks_connection()
         query = f"SELECT * FROM {DELTA_SCHEMA}.{VALIDATION_TABLE}"
-        df = pd.read_sql(query, conn)
-        conn.close()
-        return df
+        with conn.cursor() as cursor:
+            cursor.execute(query)
+            return cursor.fetchall_arrow().to_pandas()
     except Exception as e:
+        get_databricks_connection.clear()
         st.error(f"Failed to fetch validation results: {e}")
         return pd.DataFrame()
 
+@st.cache_data(ttl=600)
 def fetch_rule_metadata():
     """Fetch rule metadata from Databricks"""
+    import pandas as pd
+
     try:
         conn = get_databricks_connection()
         query = f"SELECT * FROM {DELTA_SCHEMA}.{RULE_METADATA_TABLE}"
-        df = pd.read_sql(query, conn)
-        conn.close()
-        return df
+        with conn.cursor() as cursor:
+            cursor.execute(query)
+            return cursor.fetchall_arrow().to_pandas()
     except Exception as e:
+        get_databricks_connection.clear()
         st.error(f"Failed to fetch rule metadata: {e}")
         return pd.DataFrame()
 
-def get_all_schemas():
-    """Get all available schemas from Databricks"""
-    try:
-        conn = get_databricks_connection()
-        with conn.cursor() as cursor:
-            cursor.execute("SHOW SCHEMAS")
-            results = cursor.fetchall()
-        conn.close()
-        return [row[0] for row in results]
-    except Exception as e:
-        st.error(f"Failed to fetch schemas: {e}")
-        return [DELTA_SCHEMA]
+@st.cache_data(ttl=300)
+def fetch_catalog_snapshot():
+    """Fetch the full schema -> tables map in a single round-trip
 
-def get_tables_in_schema(schema_name):
-    """Get all tables in a specific schema"""
+    SHOW SCHEMAS plus one SHOW TABLES per schema is N network round-trips
+    on a latency-bound path; information_schema answers all of them at once.
+    """
     try:
         conn = get_databricks_connection()
         with conn.cursor() as cursor:
-            cursor.execute(f"SHOW TABLES IN {schema_name}")
+            cursor.execute(
+                "SELECT table_schema, table_name "
+                "FROM system.information_schema.tables "
+                "ORDER BY table_schema, table_name"
+            )
             results = cursor.fetchall()
-        conn.close()
-        return [row[1] for row in results]  # Table name is in the second column
+        snapshot = {}
+        for schema_name, table_name in results:
+            snapshot.setdefault(schema_name, []).append(table_name)
+        return snapshot
     except Exception as e:
-        st.error(f"Failed to fetch tables in schema {schema_name}: {e}")
-        return []
+        get_databricks_connection.clear()
+        st.error(f"Failed to fetch catalog snapshot: {e}")
+        return {}
+
+def get_all_schemas(limit=None):
+    """Get available schemas from Databricks, optionally capped at limit"""
+    snapshot = fetch_catalog_snapshot()
+    schemas = list(snapshot) if snapshot else [DELTA_SCHEMA]
+    return schemas if limit is None else schemas[:limit]
+
+def get_tables_in_schema(schema_name, limit=None):
+    """Get tables in a specific schema, optionally capped at limit"""
+    tables = fetch_catalog_snapshot().get(schema_name, [])
+    return tables if limit is None else tables[:limit]
 
+def count_schemas():
+    """Total schema count, served from the cached catalog snapshot"""
+    return len(fetch_catalog_snapshot())
+
+def count_tables_in_schema(schema_name):
+    """Total table count for a schema, served from the cached snapshot"""
+    return len(fetch_catalog_snapshot().get(schema_name, []))
+
+@st.cache_data(ttl=600)
 def get_columns_in_table(schema_name, table_name):
     conn = get_databricks_connection()
     with conn.cursor() as cursor:
         cursor.execute(f"DESCRIBE TABLE {schema_name}.{table_name}")
         results = cursor.fetchall()
-    conn.close()
     return [{"Column": row[0], "DataType": row[1]} for row in results if row[0]]
 
+@st.cache_resource(show_spinner=False)
+def _http_session():
+    """Shared HTTP session so repeated job triggers reuse one pooled TLS connection"""
+    import requests
+
+    return requests.Session()
+
 def trigger_databricks_job():
-    endpoint = f"{DATABRICKS_HOST}/api/2.0/jobs/run-now"
-    headers = {"Authorization": f"Bearer {DATABRICKS_TOKEN}"}
-    payload = {"job_id": DATABRICKS_JOB_ID}
-    response = requests.post(endpoint, headers=headers, json=payload)
+    host, token, _, job_id = get_databricks_connection_params()
+    endpoint = f"{host}/api/2.0/jobs/run-now"
+    headers = {"Authorization": f"Bearer {token}"}
+    payload = {"job_id": job_id}
+    response = _http_session().post(endpoint, headers=headers, json=payload, timeout=10)
     if response.status_code == 200:
         return response.json().get("run_id")
     else:
@@ -165,7 +206,7 @@ def render():
         st.markdown("**Current Configuration:**")
         env_vars = {
             "DATABRICKS_HOST": os.getenv("DATABRICKS_HOST", "Not set"),
-            "DATABRICKS_TOKEN": "***" + os.getenv("DATABRICKS_TOKEN", "")[-4:] if os.getenv("DATABRICKS_TOKEN") else "Not set",
+            "DATABRICKS_TOKEN": mask_token(os.getenv("DATABRICKS_TOKEN")) or "Not set",
             "DATABRICKS_HTTP_PATH": os.getenv("DATABRICKS_HTTP_PATH", "Not set"),
             "DEFAULT_SCHEMA": os.getenv("DEFAULT_SCHEMA", "multitable_logistics"),
             "DEFAULT_REFRESH_INTERVAL": os.getenv("DEFAULT_REFRESH_INTERVAL", "10"),
@@ -182,12 +223,14 @@ def render():
     with col1:
         st.markdown("**Available Schemas**")
         try:
-            schemas = get_all_schemas()
+            schemas = get_all_schemas(limit=10)
             if schemas:
-                for schema in schemas[:10]:  # Show first 10 schemas
-                    st.text(f"📁 {schema}")
-                if len(schemas) > 10:
-                    st.text(f"... and {len(schemas) - 10} more")
+                # One table widget instead of a st.text per row: Streamlit
+                # re-diffs every widget on rerun, so keep this O(1)
+                st.table({"Schema": schemas})
+                total = count_schemas()
+                if total > 10:
+                    st.caption(f"... and {total - 10} more")
             else:
                 st.warning("No schemas found or connection issue")
         except Exception as e:
@@ -198,12 +241,12 @@ def render():
         current_schema = os.getenv("DEFAULT_SCHEMA", "multitable_logistics")
         
         try:
-            tables = get_tables_in_schema(current_schema)
+            tables = get_tables_in_schema(current_schema, limit=10)
             if tables:
-                for table in tables[:10]:  # Show first 10 tables
-                    st.text(f"📋 {table}")
-                if len(tables) > 10:
-                    st.text(f"... and {len(tables) - 10} more")
+                st.table({"Table": tables})
+                total = count_tables_in_schema(current_schema)
+                if total > 10:
+                    st.caption(f"... and {total - 10} more")
             else:
                 st.warning(f"No tables found in schema '{current_schema}'")
         except Exception as e:
@@ -283,7 +326,7 @@ def render():
                 "export_timestamp": datetime.now().isoformat()
             }
             
-            config_json = pd.DataFrame([config_data]).to_json(orient="records", indent=2)
+            config_json = json.dumps([config_data], indent=2, default=str)
             st.download_button(
                 label="💾 Download Configuration",
                 data=config_json,
@@ -301,9 +344,9 @@ def render():
         
         if uploaded_file is not None:
             try:
-                config_data = pd.read_json(uploaded_file)
+                config_data = json.loads(uploaded_file.read())
                 st.success("Configuration file loaded successfully!")
-                st.json(config_data.to_dict('records')[0])
+                st.json(config_data[0] if isinstance(config_data, list) else config_data)
             except Exception as e:
                 st.error(f"Failed to load configuration: {e}")
     
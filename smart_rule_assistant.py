@@ -1,16 +1,24 @@
 import streamlit as st
-import requests
+import concurrent.futures
+import functools
 import pandas as pd
 import time
-from databricks import sql
 import os
 from config import DATABRICKS_HOST, DATABRICKS_TOKEN, DATABRICKS_HTTP_PATH
+from utils import to_csv_bytes
 
 # -------------------------------
 # 🔧 Config
 # -------------------------------
+@functools.lru_cache(maxsize=1)
 def get_databricks_connection_params():
-    """Get Databricks connection parameters from environment variables"""
+    """Get Databricks connection parameters from environment variables
+
+    Cached for the life of the process: the params are read on every
+    rerun (fetches, job trigger/status, connection status expander) and
+    the environment does not change underneath a running app. Call
+    invalidate_connection_params() after rewriting .env.
+    """
     host = os.getenv("DATABRICKS_HOST", DATABRICKS_HOST)
     token = os.getenv("DATABRICKS_TOKEN", DATABRICKS_TOKEN)
     http_path = os.getenv("DATABRICKS_HTTP_PATH", DATABRICKS_HTTP_PATH)
@@ -21,31 +29,83 @@ def get_databricks_connection_params():
     
     return host, token, http_path, job_id
 
+def invalidate_connection_params():
+    """Forget the memoized params so the next call re-reads the environment"""
+    get_databricks_connection_params.cache_clear()
+
 DELTA_TABLE = "multitable_logistics.user_defined_validation_log_final_new"
 SAVED_TABLE = "multitable_logistics.user_defined_validation_log_final_for_dashboard"
 
+# Columns shown in the saved-validations preview; the SQL projection is built
+# from this, so the frame is guaranteed to carry exactly these columns and
+# render needs no per-rerun availability checks
+_PREVIEW_COLS = ("Run_Timestamp", "Rule_Display_Name", "Status")
+
+# -------------------------------
+# 🔌 Shared Connection
+# -------------------------------
+@st.cache_resource(show_spinner=False)
+def get_shared_connection():
+    """One Databricks SQL session per process; each fetch used to pay the
+    full TCP+TLS+OpenSession handshake by reconnecting"""
+    from databricks import sql
+
+    host, token, http_path, _ = get_databricks_connection_params()
+
+    return sql.connect(
+        server_hostname=host.replace("https://", ""),
+        http_path=http_path,
+        access_token=token
+    )
+
+def reset_connection():
+    """Drop the cached session (and the memoized params backing it) so the
+    next query reconnects — used on fetch errors and after reconfiguration"""
+    get_shared_connection.clear()
+    invalidate_connection_params()
+
 # -------------------------------
 # 📦 Fetch Saved Logs
 # -------------------------------
-def fetch_saved_validations():
+# Streamlit reruns the whole script on every widget interaction; without the
+# cache each expander toggle re-issued the SELECT against Databricks
+@st.cache_data(ttl=600, show_spinner="Loading saved validations...")
+def fetch_saved_validations(limit=10):
+    """Fetch the preview rows: three display columns with a server-side
+    LIMIT rather than SELECT * followed by .head() on the client"""
     try:
-        host, token, http_path, _ = get_databricks_connection_params()
-        
-        with sql.connect(
-            server_hostname=host.replace("https://", ""),
-            http_path=http_path,
-            access_token=token
-        ) as connection:
-            df = pd.read_sql(f"""
-                SELECT * 
+        connection = get_shared_connection()
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                SELECT {", ".join(_PREVIEW_COLS)}
                 FROM {SAVED_TABLE}
                 ORDER BY Run_Timestamp DESC
-            """, connection)
-            return df
+                LIMIT ?
+            """, [limit])
+            return cursor.fetchall_arrow().to_pandas()
     except Exception as e:
+        # Reconnect cleanly on the next call
+        reset_connection()
         st.error(f"❌ Failed to load saved validations: {e}")
         return pd.DataFrame()
 
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_saved_validation_counts():
+    """Fetch the two summary scalars in one aggregate round-trip"""
+    try:
+        connection = get_shared_connection()
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                SELECT COUNT(*), COUNT(DISTINCT Rule_Display_Name)
+                FROM {SAVED_TABLE}
+            """)
+            total, unique_rules = cursor.fetchone()
+        return int(total), int(unique_rules)
+    except Exception as e:
+        reset_connection()
+        st.error(f"❌ Failed to load validation counts: {e}")
+        return 0, 0
+
 # -------------------------------
 # 🧠 Smart Rule Assistant Renderer
 # -------------------------------
@@ -64,28 +124,28 @@ def render(df):
 
     # ------------------- EXISTING RULES -------------------
     st.markdown("### 📋 Previously Saved Smart Rules")
-    
+
+    if st.button("🔄 Refresh Saved Validations"):
+        fetch_saved_validations.clear()
+        fetch_saved_validation_counts.clear()
+
     with st.expander("View Saved Validations", expanded=False):
         saved_df = fetch_saved_validations()
-        
+
         if not saved_df.empty:
             # Show summary
-            total_saved = len(saved_df)
-            unique_rules = saved_df['Rule_Display_Name'].nunique() if 'Rule_Display_Name' in saved_df.columns else 0
-            
+            total_saved, unique_rules = fetch_saved_validation_counts()
+
             col1, col2 = st.columns(2)
             with col1:
                 st.metric("Total Saved Validations", total_saved)
             with col2:
                 st.metric("Unique Rules", unique_rules)
-            
-            # Show recent validations
+
+            # Show recent validations; a static HTML table skips the Arrow
+            # round-trip st.dataframe pays, which a 10x3 preview never needs
             st.markdown("#### Recent Validations")
-            display_columns = ['Run_Timestamp', 'Rule_Display_Name', 'Status'] if all(col in saved_df.columns for col in ['Run_Timestamp', 'Rule_Display_Name', 'Status']) else saved_df.columns.tolist()[:3]
-            st.dataframe(
-                saved_df[display_columns].head(10),
-                use_container_width=True
-            )
+            st.table(saved_df)
         else:
             st.info("No saved validations found yet. Create your first smart rule below!")
 
@@ -94,21 +154,25 @@ def render(df):
     # ------------------- SMART RULE INPUT -------------------
     st.markdown("### 🤖 Create New Smart Rule")
     
-    user_rule = st.text_area(
-        "Describe your validation rule in plain English:",
-        value=st.session_state.user_rule_input or "",
-        placeholder="Example: 'Check that all customer ages are between 18 and 120' or 'Ensure all email addresses contain @ symbol'",
-        height=100
-    )
-    
+    # Inside a form, typing does not rerun the script — the page only
+    # re-executes on submit, instead of once per keystroke
+    with st.form("smart_rule_form"):
+        user_rule = st.text_area(
+            "Describe your validation rule in plain English:",
+            value=st.session_state.user_rule_input or "",
+            placeholder="Example: 'Check that all customer ages are between 18 and 120' or 'Ensure all email addresses contain @ symbol'",
+            height=100
+        )
+        submitted = st.form_submit_button("🚀 Execute Smart Rule")
+
     if user_rule != st.session_state.user_rule_input:
         st.session_state.user_rule_input = user_rule
 
     # ------------------- RULE EXECUTION -------------------
     col1, col2 = st.columns([1, 1])
-    
+
     with col1:
-        if st.button("🚀 Execute Smart Rule", disabled=not user_rule.strip()):
+        if submitted:
             if user_rule.strip():
                 try:
                     # For demo purposes, we'll show a simulated execution
@@ -154,16 +218,25 @@ def render(df):
         results_df = st.session_state.validation_df
         
         if 'Violations_Found' in results_df.columns:
-            violations = results_df['Violations_Found'].iloc[0]
-            records_checked = results_df['Records_Checked'].iloc[0] if 'Records_Checked' in results_df.columns else 0
-            
+            # Recompute the summary only when the results actually change;
+            # reruns with the same frame read the memoized tuple
+            digest = int(pd.util.hash_pandas_object(results_df, index=True).sum())
+            if st.session_state.get("results_summary_key") != digest:
+                # One row -> dict, instead of a Series allocation per metric
+                row = results_df.iloc[0].to_dict()
+                violations = row.get('Violations_Found', 0)
+                records_checked = row.get('Records_Checked', 0)
+                success_rate = ((records_checked - violations) / records_checked * 100) if records_checked > 0 else 0
+                st.session_state["results_summary_key"] = digest
+                st.session_state["results_summary"] = (records_checked, violations, success_rate)
+            records_checked, violations, success_rate = st.session_state["results_summary"]
+
             col1, col2, col3 = st.columns(3)
             with col1:
                 st.metric("Records Checked", f"{records_checked:,}")
             with col2:
                 st.metric("Violations Found", violations)
             with col3:
-                success_rate = ((records_checked - violations) / records_checked * 100) if records_checked > 0 else 0
                 st.metric("Success Rate", f"{success_rate:.1f}%")
         
         # Show detailed results
@@ -184,8 +257,8 @@ def render(df):
                     st.error(f"❌ Failed to save results: {e}")
         
         with col2:
-            # Export option
-            csv_data = results_df.to_csv(index=False)
+            # Export option (cached serialization; reruns reuse the bytes)
+            csv_data = to_csv_bytes(results_df)
             st.download_button(
                 label="📥 Download Results",
                 data=csv_data,
@@ -223,25 +296,40 @@ def render(df):
             st.error(f"❌ Connection issue: {e}")
             st.warning("Please check your environment variables for Databricks connection.")
 
+@st.cache_resource(show_spinner=False)
+def _http_session():
+    """Pooled HTTP session for Jobs API calls: keep-alive skips the TLS
+    handshake on every poll, and retries cover transient REST failures"""
+    import requests
+    from requests.adapters import HTTPAdapter, Retry
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ))
+    return session
+
 def trigger_databricks_job():
     """Trigger a Databricks job for rule execution"""
     try:
         host, token, _, job_id = get_databricks_connection_params()
-        
+
         url = f"{host}/api/2.1/jobs/run-now"
         headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
         data = {"job_id": int(job_id)}
-        
-        response = requests.post(url, headers=headers, json=data)
-        
+
+        response = _http_session().post(url, headers=headers, json=data, timeout=(3, 30))
+
         if response.status_code == 200:
             return response.json().get("run_id")
         else:
             raise Exception(f"Failed to trigger job: {response.text}")
-            
+
     except Exception as e:
         st.error(f"Failed to trigger Databricks job: {e}")
         return None
@@ -250,18 +338,34 @@ def check_job_status(run_id):
     """Check the status of a Databricks job run"""
     try:
         host, token, _, _ = get_databricks_connection_params()
-        
+
         url = f"{host}/api/2.1/jobs/runs/get"
         headers = {"Authorization": f"Bearer {token}"}
         params = {"run_id": run_id}
-        
-        response = requests.get(url, headers=headers, params=params)
-        
+
+        response = _http_session().get(url, headers=headers, params=params, timeout=(3, 30))
+
         if response.status_code == 200:
             return response.json()
         else:
             raise Exception(f"Failed to check job status: {response.text}")
-            
+
     except Exception as e:
         st.error(f"Failed to check job status: {e}")
         return None
+
+def check_job_statuses(run_ids):
+    """Check several job runs concurrently
+
+    Polling serially costs one HTTP round-trip per run; fanning the polls
+    out over threads (all sharing the pooled session) pays roughly the
+    slowest round-trip instead of the sum. Returns {run_id: status_json}.
+    """
+    if not run_ids:
+        return {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(run_ids))) as executor:
+        futures = {executor.submit(check_job_status, run_id): run_id for run_id in run_ids}
+        return {
+            futures[future]: future.result()
+            for future in concurrent.futures.as_completed(futures)
+        }
@@ -3,73 +3,101 @@
 AutoDQ Comprehensive Test Suite
 One command to test everything - data generation, edge cases, and all functionality
 """
+import hashlib
 import os
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 from pathlib import Path
 from datetime import datetime
 
 # Add current directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-def run_comprehensive_tests():
-    """Run all tests and generate all test data in one comprehensive suite"""
-    print("🚀 AutoDQ Comprehensive Test Suite")
-    print("=" * 60)
-    print("Testing everything: data generation, edge cases, and all functionality")
-    print("=" * 60)
-    
-    total_tests = 0
-    passed_tests = 0
-    failed_tests = 0
-    
-    # Test 1: Enhanced Data Factory
-    print("\n📊 1. Testing Enhanced Data Factory...")
+def _write_csv(df, filepath):
+    """Write a DataFrame as CSV through Arrow's columnar C++ writer instead
+    of pandas' per-cell Python formatter"""
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), filepath)
+
+def _snapshot_dir():
+    """Parquet snapshot directory keyed by a hash of the factory sources:
+    repeat runs reload the generated datasets instead of redrawing them,
+    and any edit to the generators invalidates the snapshot automatically"""
+    digest = hashlib.sha256()
+    tests_dir = Path(__file__).parent / "tests"
+    for src in ("test_data_factory.py", "enhanced_data_factory.py"):
+        digest.update((tests_dir / src).read_bytes())
+    return Path("comprehensive_test_data") / ".cache" / digest.hexdigest()[:12]
+
+def _snapshot_frame(snapshot_dir, name, builder):
+    """Load name.parquet from the snapshot if present, else build and save"""
+    cache_file = snapshot_dir / f"{name}.parquet"
+    if cache_file.exists():
+        return pd.read_parquet(cache_file)
+    df = builder()
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(cache_file, engine="pyarrow", compression="zstd")
+    return df
+
+# Each test section is an independent function returning
+# (passed, failed, output lines, datasets generated) so the sections can
+# run concurrently on a thread pool and report in order afterwards
+
+def _test_data_factory():
+    """Test 1: Enhanced Data Factory"""
+    passed = failed = 0
+    lines = []
     try:
         from tests.test_data_factory import AutoDQTestDataFactory
-        from tests.enhanced_data_factory import EnhancedAutoDQDataFactory, get_edge_case_scenarios
-        
+        from tests.enhanced_data_factory import get_cached_validation_data, get_edge_case_scenarios
+
         # Test original factory
         factory = AutoDQTestDataFactory()
         validation_data = factory.create_validation_results_data(100)
         assert len(validation_data) == 100
         assert 'Table' in validation_data.columns
-        total_tests += 1
-        passed_tests += 1
-        print("  ✅ Original data factory: PASSED")
-        
+        passed += 1
+        lines.append("  ✅ Original data factory: PASSED")
+
         # Test enhanced factory with all industries
-        enhanced_factory = EnhancedAutoDQDataFactory()
         industries = ['enterprise', 'saas', 'ecommerce', 'financial', 'healthcare', 'manufacturing']
-        
-        for industry in industries:
-            industry_data = enhanced_factory.create_realistic_validation_data(50, industry=industry)
+
+        # Generate the six independent industry datasets concurrently
+        with ThreadPoolExecutor(max_workers=len(industries)) as ex:
+            industry_frames = list(ex.map(
+                lambda ind: get_cached_validation_data(50, industry=ind), industries
+            ))
+
+        for industry, industry_data in zip(industries, industry_frames):
             assert len(industry_data) == 50
             assert 'Table' in industry_data.columns
-            total_tests += 1
-            passed_tests += 1
-            print(f"  ✅ {industry.capitalize()} industry data: PASSED")
-        
+            passed += 1
+            lines.append(f"  ✅ {industry.capitalize()} industry data: PASSED")
+
         # Test all edge case scenarios
         edge_cases = get_edge_case_scenarios()
         expected_scenarios = ['unicode_data', 'sql_reserved_words', 'extreme_values', 'date_edge_cases', 'long_names']
-        
+
         for scenario in expected_scenarios:
             assert scenario in edge_cases
             assert not edge_cases[scenario].empty
-            total_tests += 1
-            passed_tests += 1
-            print(f"  ✅ Edge case '{scenario}': PASSED")
-            
+            passed += 1
+            lines.append(f"  ✅ Edge case '{scenario}': PASSED")
+
     except Exception as e:
-        failed_tests += 1
-        print(f"  ❌ Data factory test failed: {e}")
-        traceback.print_exc()
-    
-    # Test 2: Data Cleaning with Edge Cases
-    print("\n🧪 2. Testing Data Cleaning with All Edge Cases...")
+        failed += 1
+        lines.append(f"  ❌ Data factory test failed: {e}")
+        lines.append(traceback.format_exc())
+    return passed, failed, lines, 0
+
+def _test_data_cleaning():
+    """Test 2: Data Cleaning with Edge Cases"""
+    passed = failed = 0
+    lines = []
     try:
         # Test with Unicode and special characters
         unicode_data = pd.DataFrame({
@@ -78,25 +106,32 @@ def run_comprehensive_tests():
             'email': ['alice@test.com', '客户@test.com', None, 'invalid@', 'test@données.com'],
             'value': [100, None, '999999999999999999999', 'inf', -999]
         })
-        
+
         # Test null removal
         cleaned = unicode_data.dropna()
         assert len(cleaned) < len(unicode_data)
-        total_tests += 1
-        passed_tests += 1
-        print("  ✅ Unicode data null removal: PASSED")
-        
+        passed += 1
+        lines.append("  ✅ Unicode data null removal: PASSED")
+
         # Test with extreme values
         extreme_data = pd.DataFrame({
             'extreme_values': ['999999999999999999999', '-999999999999999999999', '1e308', 'inf', 'nan', ''],
             'table': ['test'] * 6
         })
-        extreme_data['numeric'] = pd.to_numeric(extreme_data['extreme_values'], errors='coerce')
+        # Parse through Arrow's native float reader (handles inf/nan/1e308
+        # in C++) instead of pd.to_numeric's per-element Python try/except;
+        # blanks become nulls up front since Arrow rejects '' outright
+        try:
+            extreme_data['numeric'] = pa.array(
+                extreme_data['extreme_values'].replace('', None)
+            ).cast(pa.float64(), safe=False).to_pandas()
+        except pa.ArrowInvalid:
+            # Tokens Arrow's parser rejects but errors='coerce' would null out
+            extreme_data['numeric'] = pd.to_numeric(extreme_data['extreme_values'], errors='coerce')
         assert 'numeric' in extreme_data.columns
-        total_tests += 1
-        passed_tests += 1
-        print("  ✅ Extreme values handling: PASSED")
-        
+        passed += 1
+        lines.append("  ✅ Extreme values handling: PASSED")
+
         # Test with SQL reserved words
         sql_data = pd.DataFrame({
             'Table': ['order', 'select', 'from', 'where'],
@@ -104,80 +139,84 @@ def run_comprehensive_tests():
         })
         sql_data['Table.Column'] = sql_data['Table'] + '.' + sql_data['Column']
         assert len(sql_data) == 4
-        total_tests += 1
-        passed_tests += 1
-        print("  ✅ SQL reserved words handling: PASSED")
-        
+        passed += 1
+        lines.append("  ✅ SQL reserved words handling: PASSED")
+
     except Exception as e:
-        failed_tests += 1
-        print(f"  ❌ Data cleaning test failed: {e}")
-        traceback.print_exc()
-    
-    # Test 3: Anomaly Detection with Edge Cases
-    print("\n🔍 3. Testing Anomaly Detection with All Edge Cases...")
+        failed += 1
+        lines.append(f"  ❌ Data cleaning test failed: {e}")
+        lines.append(traceback.format_exc())
+    return passed, failed, lines, 0
+
+def _test_anomaly_detection():
+    """Test 3: Anomaly Detection with Edge Cases"""
+    passed = failed = 0
+    lines = []
     try:
+        from joblib import parallel_backend
         from sklearn.ensemble import IsolationForest
-        from scipy.stats import zscore
-        
-        # Test with normal data + outliers
-        np.random.seed(42)
-        normal_data = np.random.normal(50, 10, 95)
+        from tests._fast_stats import zscore_outlier_mask
+
+        # Test with normal data + outliers; a local generator keeps the
+        # draw reproducible without touching shared np.random state
+        rng = np.random.RandomState(42)
+        normal_data = rng.normal(50, 10, 95)
         outliers = [200, -100, 300, -150, 250]
         all_values = np.concatenate([normal_data, outliers])
-        
+
         anomaly_data = pd.DataFrame({
             'Failed_Value_num': all_values,
             'Table': ['test_table'] * len(all_values)
         })
-        
-        # Test Z-Score method
-        z_scores = zscore(anomaly_data['Failed_Value_num'])
-        z_anomalies = np.abs(z_scores) > 3
+
+        # Test Z-Score method (single fused pass, no normalized temporary)
+        z_anomalies = zscore_outlier_mask(anomaly_data['Failed_Value_num'], 3.0)
         assert np.sum(z_anomalies) > 0
-        total_tests += 1
-        passed_tests += 1
-        print("  ✅ Z-Score anomaly detection: PASSED")
-        
-        # Test Isolation Forest
-        model = IsolationForest(contamination=0.05, random_state=42)
-        predictions = model.fit_predict(anomaly_data[['Failed_Value_num']])
+        passed += 1
+        lines.append("  ✅ Z-Score anomaly detection: PASSED")
+
+        # Test Isolation Forest; fan the per-sample work across cores, and
+        # hand sklearn a contiguous ndarray so it skips the DataFrame copy
+        model = IsolationForest(contamination=0.05, random_state=42, n_jobs=-1)
+        with parallel_backend('threading', n_jobs=-1):
+            predictions = model.fit_predict(anomaly_data[['Failed_Value_num']].to_numpy())
         if_anomalies = predictions == -1
         assert np.sum(if_anomalies) > 0
-        total_tests += 1
-        passed_tests += 1
-        print("  ✅ Isolation Forest anomaly detection: PASSED")
-        
+        passed += 1
+        lines.append("  ✅ Isolation Forest anomaly detection: PASSED")
+
         # Test with constant values (edge case)
         constant_data = pd.DataFrame({'values': [5.0] * 100})
-        z_scores_constant = zscore(constant_data['values'])
-        # Should handle without crashing (results in NaN for constant values)
-        assert len(z_scores_constant) == 100
-        total_tests += 1
-        passed_tests += 1
-        print("  ✅ Constant values edge case: PASSED")
-        
+        constant_mask = zscore_outlier_mask(constant_data['values'])
+        # Constant input has no defined z-score; the mask is all-False
+        assert len(constant_mask) == 100 and not constant_mask.any()
+        passed += 1
+        lines.append("  ✅ Constant values edge case: PASSED")
+
     except Exception as e:
-        failed_tests += 1
-        print(f"  ❌ Anomaly detection test failed: {e}")
-        traceback.print_exc()
-    
-    # Test 4: Data Processing Edge Cases
-    print("\n💾 4. Testing Data Processing with All Edge Cases...")
+        failed += 1
+        lines.append(f"  ❌ Anomaly detection test failed: {e}")
+        lines.append(traceback.format_exc())
+    return passed, failed, lines, 0
+
+def _test_data_processing():
+    """Test 4: Data Processing Edge Cases"""
+    passed = failed = 0
+    lines = []
     try:
         # Test with mixed data types
         mixed_data = pd.DataFrame({
             'mixed_column': [123, '123', 123.45, True, None, 'text', np.inf, np.nan],
             'Table': ['mixed_table'] * 8
         })
-        
+
         # Test preprocessing (as done in app.py)
         processed = mixed_data.copy()
         processed.columns = processed.columns.str.strip()
         assert len(processed) == 8
-        total_tests += 1
-        passed_tests += 1
-        print("  ✅ Mixed data types processing: PASSED")
-        
+        passed += 1
+        lines.append("  ✅ Mixed data types processing: PASSED")
+
         # Test with very long names
         long_names_data = pd.DataFrame({
             'Table': ['a' * 255],  # Very long table name
@@ -185,10 +224,9 @@ def run_comprehensive_tests():
         })
         long_names_data['Table.Column'] = long_names_data['Table'] + '.' + long_names_data['Column']
         assert len(long_names_data['Table.Column'].iloc[0]) > 500
-        total_tests += 1
-        passed_tests += 1
-        print("  ✅ Long names handling: PASSED")
-        
+        passed += 1
+        lines.append("  ✅ Long names handling: PASSED")
+
         # Test with date edge cases
         date_data = pd.DataFrame({
             'dates': ['2023-01-01', '2023-13-45', '2023-02-29', 'not-a-date', None]
@@ -196,72 +234,128 @@ def run_comprehensive_tests():
         date_data['parsed_dates'] = pd.to_datetime(date_data['dates'], errors='coerce')
         valid_dates = date_data['parsed_dates'].notna().sum()
         assert valid_dates > 0  # At least some dates should be valid
-        total_tests += 1
-        passed_tests += 1
-        print("  ✅ Date edge cases handling: PASSED")
-        
+        passed += 1
+        lines.append("  ✅ Date edge cases handling: PASSED")
+
     except Exception as e:
-        failed_tests += 1
-        print(f"  ❌ Data processing test failed: {e}")
-        traceback.print_exc()
-    
-    # Test 5: Generate All Test Data
-    print("\n📁 5. Generating All Test Data...")
+        failed += 1
+        lines.append(f"  ❌ Data processing test failed: {e}")
+        lines.append(traceback.format_exc())
+    return passed, failed, lines, 0
+
+def _generate_all_test_data():
+    """Test 5: Generate All Test Data"""
+    passed = failed = 0
+    lines = []
+    datasets_generated = 0
     try:
+        from tests.test_data_factory import AutoDQTestDataFactory
+        from tests.enhanced_data_factory import get_cached_validation_data, get_edge_case_scenarios
+
         # Create test data directory
         test_data_dir = Path("comprehensive_test_data")
         test_data_dir.mkdir(exist_ok=True)
-        
-        datasets_generated = 0
-        
+
         # Generate original test datasets
         factory = AutoDQTestDataFactory()
         original_datasets = factory.create_comprehensive_test_suite()
-        
+
         for name, df in original_datasets.items():
             if not df.empty:
                 filepath = test_data_dir / f"original_{name}.csv"
-                df.to_csv(filepath, index=False)
+                _write_csv(df, filepath)
                 datasets_generated += 1
-        
+
         # Generate industry-specific datasets
-        enhanced_factory = EnhancedAutoDQDataFactory()
         industries = ['enterprise', 'saas', 'ecommerce', 'financial', 'healthcare', 'manufacturing']
-        
-        for industry in industries:
-            industry_data = enhanced_factory.create_realistic_validation_data(200, industry=industry, include_edge_cases=True)
+
+        # Memoized (see Test 1), snapshot-cached across interpreter runs,
+        # and generated concurrently; writes stay on the main thread since
+        # Arrow's CSV writer does the heavy lifting
+        snapshot_dir = _snapshot_dir()
+        with ThreadPoolExecutor(max_workers=len(industries)) as ex:
+            industry_frames = list(ex.map(
+                lambda ind: _snapshot_frame(
+                    snapshot_dir,
+                    f"industry_{ind}",
+                    lambda: get_cached_validation_data(200, industry=ind, include_edge_cases=True)
+                ),
+                industries
+            ))
+
+        for industry, industry_data in zip(industries, industry_frames):
             filepath = test_data_dir / f"industry_{industry}.csv"
-            industry_data.to_csv(filepath, index=False)
+            _write_csv(industry_data, filepath)
             datasets_generated += 1
-        
+
         # Generate all edge case scenarios
         edge_cases = get_edge_case_scenarios()
         for name, df in edge_cases.items():
             filepath = test_data_dir / f"edge_case_{name}.csv"
-            df.to_csv(filepath, index=False)
+            _write_csv(df, filepath)
             datasets_generated += 1
-        
-        # Generate mixed scenario (all edge cases combined)
-        mixed_scenarios = []
-        for df in edge_cases.values():
-            mixed_scenarios.append(df)
-        
+
+        # Generate mixed scenario (all edge cases combined); concatenate at
+        # the Arrow level so the heterogeneous Failed_Value columns never go
+        # through a pandas block rewrite, and write straight to CSV
+        mixed_scenarios = [
+            pa.Table.from_pandas(df, preserve_index=False)
+            for df in edge_cases.values()
+        ]
+
         if mixed_scenarios:
-            combined_edge_cases = pd.concat(mixed_scenarios, ignore_index=True)
+            try:
+                combined_edge_cases = pa.concat_tables(mixed_scenarios, promote_options="default")
+            except TypeError:  # pyarrow < 14 spells the option promote=
+                combined_edge_cases = pa.concat_tables(mixed_scenarios, promote=True)
             filepath = test_data_dir / "comprehensive_all_edge_cases.csv"
-            combined_edge_cases.to_csv(filepath, index=False)
+            pa_csv.write_csv(combined_edge_cases, filepath)
             datasets_generated += 1
-        
-        total_tests += 1
-        passed_tests += 1
-        print(f"  ✅ Generated {datasets_generated} comprehensive test datasets")
-        print(f"  📂 Saved to: {test_data_dir}/")
-        
+
+        passed += 1
+        lines.append(f"  ✅ Generated {datasets_generated} comprehensive test datasets")
+        lines.append(f"  📂 Saved to: {test_data_dir}/")
+
     except Exception as e:
-        failed_tests += 1
-        print(f"  ❌ Test data generation failed: {e}")
-        traceback.print_exc()
-    
+        failed += 1
+        lines.append(f"  ❌ Test data generation failed: {e}")
+        lines.append(traceback.format_exc())
+    return passed, failed, lines, datasets_generated
+
+_TEST_SECTIONS = (
+    ("📊 1. Testing Enhanced Data Factory...", _test_data_factory),
+    ("🧪 2. Testing Data Cleaning with All Edge Cases...", _test_data_cleaning),
+    ("🔍 3. Testing Anomaly Detection with All Edge Cases...", _test_anomaly_detection),
+    ("💾 4. Testing Data Processing with All Edge Cases...", _test_data_processing),
+    ("📁 5. Generating All Test Data...", _generate_all_test_data),
+)
+
+def run_comprehensive_tests():
+    """Run all tests and generate all test data in one comprehensive suite"""
+    print("🚀 AutoDQ Comprehensive Test Suite")
+    print("=" * 60)
+    print("Testing everything: data generation, edge cases, and all functionality")
+    print("=" * 60)
+
+    # The five sections are independent, so run them concurrently; each
+    # buffers its own output so the report still prints in order
+    with ThreadPoolExecutor(max_workers=len(_TEST_SECTIONS)) as ex:
+        futures = [ex.submit(section) for _, section in _TEST_SECTIONS]
+        results = [future.result() for future in futures]
+
+    passed_tests = 0
+    failed_tests = 0
+    datasets_generated = 0
+    for (header, _), (passed, failed, lines, generated) in zip(_TEST_SECTIONS, results):
+        print("\n" + header)
+        for line in lines:
+            print(line)
+        passed_tests += passed
+        failed_tests += failed
+        datasets_generated += generated
+
+    total_tests = passed_tests + failed_tests
+
     # Final Results
     print("\n" + "=" * 60)
     print("📊 COMPREHENSIVE TEST RESULTS")
@@ -270,7 +364,7 @@ def run_comprehensive_tests():
     print(f"✅ Passed: {passed_tests}")
     print(f"❌ Failed: {failed_tests}")
     print(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%" if total_tests > 0 else "N/A")
-    
+
     if failed_tests == 0:
         print("\n🎉 ALL TESTS PASSED!")
         print("\n✨ Your AutoDQ application is comprehensively tested and ready!")
@@ -288,10 +382,10 @@ def run_comprehensive_tests():
         print("   • Industry-specific naming patterns")
         print("   • Edge case scenarios")
         print("   • Combined comprehensive dataset")
-        
+
     else:
         print(f"\n⚠️  {failed_tests} tests failed. Please review the error messages above.")
-    
+
     print("\n" + "=" * 60)
     return failed_tests == 0
 
@@ -5,7 +5,8 @@ Generates test data that matches various company naming conventions and edge cas
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import random
+import functools
+import re
 import string
 from typing import Dict, List, Optional, Union
 
@@ -95,6 +96,55 @@ class EnhancedAutoDQDataFactory:
         ]
     }
     
+    # Flattened ndarray views of the pattern pools, materialized once at
+    # class definition so generation calls skip the per-call list rebuilds
+    # and can sample through NumPy instead of random.sample's swap loop
+    _ALL_TABLES_ARR = np.array(
+        [t for pattern_list in REAL_WORLD_TABLE_PATTERNS.values() for t in pattern_list],
+        dtype=object
+    )
+    _COLUMN_POOL_ARRS = {
+        name: np.array(values, dtype=object)
+        for name, values in REAL_WORLD_COLUMN_PATTERNS.items()
+    }
+    _PROBLEMATIC_ARRS = {
+        name: np.array(values, dtype=object)
+        for name, values in PROBLEMATIC_PATTERNS.items()
+    }
+    _PROBLEMATIC_KEYS = tuple(PROBLEMATIC_PATTERNS)
+
+    # Candidate failed values, precomputed once as object arrays so bulk
+    # generation selects by C-level integer indexing instead of dispatching
+    # through per-row string checks and random.choice
+    _RULE_FAILED_POOLS = {
+        rule: np.array(values, dtype=object)
+        for rule, values in {
+            'No Nulls': [None, '', '   ', 'NULL', 'null', 'None'],
+            'Email Format': ['invalid-email', 'user@', '@domain.com', 'user.domain.com', 'user@domain'],
+            'Phone Format': ['123', '123-45', '123-456-78901', 'abc-def-ghij', '(555) 123'],
+            'Date Format': ['2023-13-45', '32/01/2023', 'not-a-date', '2023/02/30', '99/99/99'],
+            'Credit Card Format': ['1234', '1234-5678-9012', '4111-1111-1111-111', 'invalid-card'],
+            'Range OK': ['-999', '999999999', '0', '-1', 'out-of-range'],
+            'Valid Type': ['text-not-number', '123abc', 'true/false', 'invalid-type'],
+            'Format Match': ['invalid-format', '123-abc', 'WRONG_CASE', 'missing-parts'],
+            'Unique Values': ['duplicate-value', 'repeated-entry', 'same-value'],
+            'Allowed Values': ['invalid-option', 'not-in-list', 'wrong-choice', 'bad-enum']
+        }.items()
+    }
+
+    # Context pools dispatched by one precompiled alternation: a single
+    # compiled-automaton scan per column name classifies it, instead of one
+    # substring pass per keyword, and the match group picks the pool
+    _CONTEXT_RE = re.compile(r'(email)|(phone)|(date|time)|(price|amount)')
+    _CONTEXT_POOLS = (
+        np.array(['invalid@', 'user.domain.com', 'not-an-email'], dtype=object),
+        np.array(['123', '123-45-678901', 'abc-def-ghij'], dtype=object),
+        np.array(['2023-13-45', 'not-a-date', '32/01/2023'], dtype=object),
+        np.array(['-999', '999999999', 'not-a-number'], dtype=object),
+    )
+
+    _GENERIC_FAILED_POOL = np.array(['generic-error-value'], dtype=object)
+
     @classmethod
     def create_realistic_validation_data(
         cls,
@@ -112,35 +162,38 @@ class EnhancedAutoDQDataFactory:
             include_edge_cases: Whether to include problematic naming patterns
             failure_rate: Proportion of validations that should fail
         """
+        # One PCG64 generator for every draw in this call; the legacy
+        # np.random/random module calls each paid global-state dispatch
+        rng = np.random.default_rng()
+
         # Select table and column patterns based on industry
         if industry == 'mixed':
-            all_tables = []
-            for pattern_list in cls.REAL_WORLD_TABLE_PATTERNS.values():
-                all_tables.extend(pattern_list)
-            tables = random.sample(all_tables, min(10, len(all_tables)))
+            tables = list(rng.choice(
+                cls._ALL_TABLES_ARR, min(10, len(cls._ALL_TABLES_ARR)), replace=False
+            ))
         else:
             tables = cls.REAL_WORLD_TABLE_PATTERNS.get(industry, ['generic_table'])
-        
+
         # Build column mappings
         columns_by_table = {}
         for table in tables:
             base_columns = []
             # Add different types of columns
-            base_columns.extend(random.sample(cls.REAL_WORLD_COLUMN_PATTERNS['ids'], 1))
-            base_columns.extend(random.sample(cls.REAL_WORLD_COLUMN_PATTERNS['names'], 2))
-            base_columns.extend(random.sample(cls.REAL_WORLD_COLUMN_PATTERNS['dates'], 1))
-            base_columns.extend(random.sample(cls.REAL_WORLD_COLUMN_PATTERNS['amounts'], 1))
-            base_columns.extend(random.sample(cls.REAL_WORLD_COLUMN_PATTERNS['flags'], 1))
-            
+            base_columns.extend(rng.choice(cls._COLUMN_POOL_ARRS['ids'], 1, replace=False))
+            base_columns.extend(rng.choice(cls._COLUMN_POOL_ARRS['names'], 2, replace=False))
+            base_columns.extend(rng.choice(cls._COLUMN_POOL_ARRS['dates'], 1, replace=False))
+            base_columns.extend(rng.choice(cls._COLUMN_POOL_ARRS['amounts'], 1, replace=False))
+            base_columns.extend(rng.choice(cls._COLUMN_POOL_ARRS['flags'], 1, replace=False))
+
             # Add edge cases if requested
             if include_edge_cases:
-                if random.random() < 0.3:  # 30% chance of problematic names
-                    problematic_type = random.choice(list(cls.PROBLEMATIC_PATTERNS.keys()))
-                    base_columns.extend(random.sample(cls.PROBLEMATIC_PATTERNS[problematic_type], 1))
-                
-                if random.random() < 0.2:  # 20% chance of international names
-                    base_columns.extend(random.sample(cls.REAL_WORLD_COLUMN_PATTERNS['international'], 1))
-            
+                if rng.random() < 0.3:  # 30% chance of problematic names
+                    problematic_type = cls._PROBLEMATIC_KEYS[rng.integers(len(cls._PROBLEMATIC_KEYS))]
+                    base_columns.extend(rng.choice(cls._PROBLEMATIC_ARRS[problematic_type], 1))
+
+                if rng.random() < 0.2:  # 20% chance of international names
+                    base_columns.extend(rng.choice(cls._COLUMN_POOL_ARRS['international'], 1))
+
             columns_by_table[table] = base_columns
         
         # Generate realistic validation rules
@@ -167,50 +220,91 @@ class EnhancedAutoDQDataFactory:
             'Regular Expression Match', 'Business Logic Validation', 'Cross-Field Validation'
         ]
         
-        data = []
-        for i in range(num_rows):
-            table = random.choice(tables)
-            column = random.choice(columns_by_table.get(table, ['unknown_column']))
-            rule = random.choice(realistic_rules)
-            metric = random.choice(realistic_metrics)
-            
-            # Determine status based on failure rate
-            status = 'Failed' if random.random() < failure_rate else 'Passed'
-            
-            # Generate realistic timestamps
-            days_back = random.randint(0, 30)  # Last 30 days
-            hours_back = random.randint(0, 23)
-            minutes_back = random.randint(0, 59)
-            timestamp = datetime.now() - timedelta(days=days_back, hours=hours_back, minutes=minutes_back)
-            
-            # Generate realistic failed values
-            failed_value = None
-            failed_row_id = None
-            if status == 'Failed':
-                failed_value = cls._generate_realistic_failed_value(rule, column)
-                failed_row_id = random.randint(1, 1000000)
-            
-            data.append({
-                'Run_Timestamp': timestamp,
-                'Table': table,
-                'Column': column,
-                'Rule': rule,
-                'Status': status,
-                'Metric': metric,
-                'Failed_Value': failed_value,
-                'Failed_Row_ID': failed_row_id
-            })
-        
-        return pd.DataFrame(data)
+        # Draw every column in bulk instead of assembling num_rows dicts in a
+        # Python loop; the only remaining loops are O(#tables) masked fills
+        table_arr = rng.choice(np.array(tables, dtype=object), size=num_rows)
+
+        column_arr = np.empty(num_rows, dtype=object)
+        for table in tables:
+            mask = table_arr == table
+            hits = int(mask.sum())
+            if hits:
+                column_arr[mask] = rng.choice(
+                    np.array(columns_by_table.get(table, ['unknown_column']), dtype=object),
+                    size=hits
+                )
+
+        rule_arr = rng.choice(np.array(realistic_rules, dtype=object), size=num_rows)
+        metric_arr = rng.choice(np.array(realistic_metrics, dtype=object), size=num_rows)
+
+        # Determine status based on failure rate, as one vectorized draw
+        status_arr = np.where(rng.random(num_rows) < failure_rate, 'Failed', 'Passed')
+
+        # Realistic timestamps spread over the last 30 days
+        minutes_back = rng.integers(0, 30 * 24 * 60, size=num_rows)
+        timestamps = pd.Timestamp.now() - pd.to_timedelta(minutes_back, unit='m')
+
+        # Failed values / row ids only where the status demands them;
+        # row ids live in a float64 column (NaN for passing rows) so the
+        # frame carries no mixed int/None object column
+        failed_value = np.full(num_rows, None, dtype=object)
+        failed_row_id = np.full(num_rows, np.nan)
+        failed_idx = np.nonzero(status_arr == 'Failed')[0]
+        if failed_idx.size:
+            failed_value[failed_idx] = cls._draw_failed_values(
+                rule_arr[failed_idx], column_arr[failed_idx], rng=rng
+            )
+            failed_row_id[failed_idx] = rng.integers(1, 1_000_001, size=failed_idx.size)
+
+        return cls._dictionary_encode(pd.DataFrame({
+            'Run_Timestamp': timestamps,
+            'Table': table_arr,
+            'Column': column_arr,
+            'Rule': rule_arr,
+            'Status': status_arr,
+            'Metric': metric_arr,
+            'Failed_Value': failed_value,
+            # Numeric view coerced once here, vectorized, so consumers like
+            # the anomaly page get a ready float64 column instead of
+            # re-running pd.to_numeric over the object column per render
+            'Failed_Value_num': pd.to_numeric(pd.Series(failed_value, dtype=object), errors='coerce'),
+            'Failed_Row_ID': failed_row_id
+        }))
+
+    # Low-cardinality string columns kept as categoricals: small integer
+    # codes plus one dictionary instead of a PyObject pointer per cell,
+    # which also lets Arrow/Parquet writers dictionary-encode directly
+    _CATEGORICAL_COLS = ('Table', 'Column', 'Rule', 'Status', 'Metric')
+
+    @classmethod
+    def _dictionary_encode(cls, frame: pd.DataFrame) -> pd.DataFrame:
+        for col in cls._CATEGORICAL_COLS:
+            frame[col] = frame[col].astype('category')
+        return frame
     
     @classmethod
     def create_edge_case_scenarios(cls) -> Dict[str, pd.DataFrame]:
         """Create specific edge case scenarios that companies encounter"""
         scenarios = {}
-        
+
+        # One timestamp for the whole batch: a broadcast datetime64 column
+        # instead of a fresh Python datetime object per cell
+        now64 = pd.Timestamp.now().to_datetime64()
+
+        def ts(n):
+            return np.full(n, now64)
+
+        # Random filler strings built as one vectorized byte-table lookup
+        # plus a single decode, instead of k Python-level random.choices
+        rng = np.random.default_rng()
+
+        def rand_text(alphabet, k):
+            lut = np.frombuffer(alphabet.encode('ascii'), dtype=np.uint8)
+            return lut[rng.integers(0, len(lut), k)].tobytes().decode('ascii')
+
         # Scenario 1: Unicode and International Data
         scenarios['unicode_data'] = pd.DataFrame({
-            'Run_Timestamp': [datetime.now()] * 8,
+            'Run_Timestamp': ts(8),
             'Table': ['客户表', 'заказы', 'productos', 'données', 'データ', '테이블', 'جدول', 'טבלה'],
             'Column': ['客户_id', 'заказ_номер', 'precio€', 'nom_français', 'データ値', '필드명', 'قيمة', 'ערך'],
             'Rule': ['No Nulls'] * 8,
@@ -222,7 +316,7 @@ class EnhancedAutoDQDataFactory:
         
         # Scenario 2: SQL Reserved Words and Special Characters
         scenarios['sql_reserved_words'] = pd.DataFrame({
-            'Run_Timestamp': [datetime.now()] * 10,
+            'Run_Timestamp': ts(10),
             'Table': ['order', 'select', 'from', 'where', 'group', 'table-name', 'field with spaces', 'UPPERCASE', 'MixedCase', '123_numeric'],
             'Column': ['order', 'select', 'from-field', 'where_clause', 'group by', 'field@symbol', 'field with spaces', 'FIELD', 'fieldName', '1st_column'],
             'Rule': ['No Nulls'] * 10,
@@ -234,7 +328,7 @@ class EnhancedAutoDQDataFactory:
         
         # Scenario 3: Extreme Values and Data Types
         scenarios['extreme_values'] = pd.DataFrame({
-            'Run_Timestamp': [datetime.now()] * 12,
+            'Run_Timestamp': ts(12),
             'Table': ['numeric_extremes'] * 12,
             'Column': ['extreme_values'] * 12,
             'Rule': ['Range OK'] * 12,
@@ -259,7 +353,7 @@ class EnhancedAutoDQDataFactory:
         
         # Scenario 4: Date and Time Edge Cases
         scenarios['date_edge_cases'] = pd.DataFrame({
-            'Run_Timestamp': [datetime.now()] * 15,
+            'Run_Timestamp': ts(15),
             'Table': ['date_tests'] * 15,
             'Column': ['date_field'] * 15,
             'Rule': ['Valid Date'] * 15,
@@ -287,7 +381,7 @@ class EnhancedAutoDQDataFactory:
         
         # Scenario 5: Long Field Names and Values
         scenarios['long_names'] = pd.DataFrame({
-            'Run_Timestamp': [datetime.now()] * 5,
+            'Run_Timestamp': ts(5),
             'Table': [
                 'a' * 64,   # Long table name
                 'b' * 128,  # Very long table name
@@ -309,41 +403,54 @@ class EnhancedAutoDQDataFactory:
                 'x' * 1000,  # Very long value
                 'y' * 5000,  # Extremely long value
                 'z' * 10000, # Maximum long value
-                ''.join(random.choices(string.ascii_letters + string.digits, k=2000)),
-                ''.join(random.choices(string.ascii_letters + string.digits + string.punctuation, k=3000))
+                rand_text(string.ascii_letters + string.digits, 2000),
+                rand_text(string.ascii_letters + string.digits + string.punctuation, 3000)
             ],
             'Failed_Row_ID': list(range(1, 6))
         })
         
-        return scenarios
+        return {name: cls._dictionary_encode(frame) for name, frame in scenarios.items()}
     
+    @classmethod
+    def _draw_failed_values(cls, rules: np.ndarray, columns: np.ndarray, rng=None) -> np.ndarray:
+        """Draw realistic failed values for a batch of failed rows
+
+        Rows whose column name matches a context keyword draw from that
+        context's pool; the rest draw from their rule's pool. Each bucket is
+        filled with one randint-indexed selection rather than a per-row call.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        n = len(rules)
+        out = np.empty(n, dtype=object)
+        cols_lower = pd.Series(columns, dtype=object).str.lower()
+
+        # One regex pass over the batch; each group column is non-null where
+        # the corresponding context matched
+        groups = cols_lower.str.extract(cls._CONTEXT_RE, expand=True)
+        assigned = np.zeros(n, dtype=bool)
+        for group_idx, pool in enumerate(cls._CONTEXT_POOLS):
+            mask = groups[group_idx].notna().to_numpy() & ~assigned
+            hits = int(mask.sum())
+            if hits:
+                out[mask] = pool[rng.integers(0, len(pool), hits)]
+                assigned |= mask
+
+        remaining = ~assigned
+        if remaining.any():
+            for rule in np.unique(rules[remaining]):
+                mask = remaining & (rules == rule)
+                pool = cls._RULE_FAILED_POOLS.get(rule, cls._GENERIC_FAILED_POOL)
+                out[mask] = pool[rng.integers(0, len(pool), int(mask.sum()))]
+
+        return out
+
     @classmethod
     def _generate_realistic_failed_value(cls, rule: str, column: str) -> str:
-        """Generate realistic failed values based on rule and column context"""
-        rule_patterns = {
-            'No Nulls': [None, '', '   ', 'NULL', 'null', 'None'],
-            'Email Format': ['invalid-email', 'user@', '@domain.com', 'user.domain.com', 'user@domain'],
-            'Phone Format': ['123', '123-45', '123-456-78901', 'abc-def-ghij', '(555) 123'],
-            'Date Format': ['2023-13-45', '32/01/2023', 'not-a-date', '2023/02/30', '99/99/99'],
-            'Credit Card Format': ['1234', '1234-5678-9012', '4111-1111-1111-111', 'invalid-card'],
-            'Range OK': ['-999', '999999999', '0', '-1', 'out-of-range'],
-            'Valid Type': ['text-not-number', '123abc', 'true/false', 'invalid-type'],
-            'Format Match': ['invalid-format', '123-abc', 'WRONG_CASE', 'missing-parts'],
-            'Unique Values': ['duplicate-value', 'repeated-entry', 'same-value'],
-            'Allowed Values': ['invalid-option', 'not-in-list', 'wrong-choice', 'bad-enum']
-        }
-        
-        # Context-aware failed values based on column name
-        if 'email' in column.lower():
-            return random.choice(['invalid@', 'user.domain.com', 'not-an-email'])
-        elif 'phone' in column.lower():
-            return random.choice(['123', '123-45-678901', 'abc-def-ghij'])
-        elif 'date' in column.lower() or 'time' in column.lower():
-            return random.choice(['2023-13-45', 'not-a-date', '32/01/2023'])
-        elif 'price' in column.lower() or 'amount' in column.lower():
-            return random.choice(['-999', '999999999', 'not-a-number'])
-        else:
-            return random.choice(rule_patterns.get(rule, ['generic-error-value']))
+        """Generate one realistic failed value based on rule and column context"""
+        return cls._draw_failed_values(
+            np.array([rule], dtype=object), np.array([column], dtype=object)
+        )[0]
 
 
 # Convenience functions
@@ -359,6 +466,21 @@ def get_edge_case_scenarios() -> Dict[str, pd.DataFrame]:
     """Get all edge case scenarios"""
     return EnhancedAutoDQDataFactory.create_edge_case_scenarios()
 
+@functools.lru_cache(maxsize=32)
+def _cached_validation_data(num_rows: int, industry: str, include_edge_cases: bool) -> pd.DataFrame:
+    return EnhancedAutoDQDataFactory.create_realistic_validation_data(
+        num_rows=num_rows,
+        industry=industry,
+        include_edge_cases=include_edge_cases
+    )
+
+def get_cached_validation_data(num_rows: int = 1000, industry: str = 'mixed',
+                               include_edge_cases: bool = False) -> pd.DataFrame:
+    """Memoized variant of create_realistic_validation_data for test suites
+    that ask for the same (industry, rows, edge-cases) dataset more than once;
+    returns a copy so callers can mutate freely"""
+    return _cached_validation_data(num_rows, industry, include_edge_cases).copy()
+
 
 if __name__ == "__main__":
     # Generate sample realistic data
@@ -2,22 +2,123 @@
 Test Data Factory for AutoDQ Testing
 Creates realistic test datasets that mimic your Databricks table structures
 """
+import functools
+import inspect
+
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import random
 from typing import Dict, List, Optional
 
 
+def _memoize_seeded(func):
+    """Seed-keyed memoization for the factory methods.
+
+    Fixtures tend to request the same seeded dataset many times per
+    session; identical fully-seeded calls return a copy of the cached
+    result instead of re-running the draws. Calls without an integer
+    seed are non-deterministic by design and bypass the cache.
+    """
+    cached = functools.lru_cache(maxsize=32)(func)
+    sig = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        if not isinstance(bound.arguments.get('seed'), (int, np.integer)):
+            return func(*args, **kwargs)
+        if isinstance(bound.arguments.get('tables'), list):
+            bound.arguments['tables'] = tuple(bound.arguments['tables'])
+        result = cached(**bound.arguments)
+        if isinstance(result, dict):
+            return {name: df.copy() for name, df in result.items()}
+        return result.copy()
+
+    return wrapper
+
+
 class AutoDQTestDataFactory:
     """Factory class for generating test data that matches AutoDQ's expected schemas"""
-    
+
+    # Constant lookup pools materialized once at class definition as object
+    # ndarrays, so the generation methods index them directly instead of
+    # rebuilding lists/dicts and converting per call
+    _DEFAULT_TABLES = np.array(
+        ['customers', 'orders', 'products', 'inventory', 'payments', 'users'],
+        dtype=object
+    )
+
+    _COLS_BY_TABLE = {
+        table: np.array(cols, dtype=object)
+        for table, cols in {
+            'customers': ['customer_id', 'email', 'phone', 'registration_date', 'status'],
+            'orders': ['order_id', 'customer_id', 'order_date', 'total_amount', 'status'],
+            'products': ['product_id', 'name', 'price', 'category', 'stock_quantity'],
+            'inventory': ['product_id', 'location', 'quantity', 'last_updated'],
+            'payments': ['payment_id', 'order_id', 'amount', 'payment_date', 'method'],
+            'users': ['user_id', 'username', 'email', 'created_at', 'is_active']
+        }.items()
+    }
+
+    _UNKNOWN_COLS = np.array(['unknown_column'], dtype=object)
+
+    _RULES = np.array([
+        'No Nulls', 'Unique Values', 'Primary Key Present', 'Foreign Key Valid',
+        'Range OK', 'Valid Type', 'Format Match', 'Column Present',
+        'Allowed Values', 'Valid Date'
+    ], dtype=object)
+
+    _METRICS = np.array([
+        'Column Values Not Null', 'Uniqueness Check', 'Primary Key Validation',
+        'Foreign Key Validation', 'Value Range Check', 'Data Type Validation',
+        'Format Validation', 'Column Existence Check', 'Domain Value Check',
+        'Date Format Validation'
+    ], dtype=object)
+
+    _FAILED_VALUES_BY_RULE = {
+        'No Nulls': None,
+        'Unique Values': 'duplicate_value',
+        'Primary Key Present': None,
+        'Foreign Key Valid': 'invalid_foreign_key_999999',
+        'Range OK': '-999',
+        'Valid Type': 'invalid_type_string',
+        'Format Match': 'invalid-format-123',
+        'Column Present': 'missing_column',
+        'Allowed Values': 'invalid_domain_value',
+        'Valid Date': '2023-13-45'  # Invalid date
+    }
+
+    # Aligned with _RULES so rule indices double as failed-value indices
+    _FAILED_VALUES = np.array(
+        [_FAILED_VALUES_BY_RULE.get(rule, 'generic_error_value') for rule in _RULES],
+        dtype=object
+    )
+
+    _DEFAULT_USER_TABLES = np.array(
+        ['inventory', 'sales', 'customers', 'orders'], dtype=object
+    )
+
+    _USER_RULES = np.array([
+        'Custom Business Rule', 'Data Quality Check', 'Business Logic Validation',
+        'Custom Range Check', 'Cross-Table Validation', 'Complex Business Rule'
+    ], dtype=object)
+
+    # The user-rule column names cycle over 5 values, so they live in a
+    # lookup table indexed by row number modulo 5
+    _CUSTOM_COLS = np.array(
+        [f'custom_column_{i}' for i in range(5)], dtype=object
+    )
+
     @staticmethod
+    @_memoize_seeded
     def create_validation_results_data(
         num_rows: int = 100,
         tables: List[str] = None,
         failure_rate: float = 0.2,
-        date_range_days: int = 7
+        date_range_days: int = 7,
+        seed: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Create test data matching gx_validation_results_cleaned_combined table structure
@@ -27,237 +128,319 @@ class AutoDQTestDataFactory:
             tables: List of table names to use (defaults to common ones)
             failure_rate: Proportion of validations that should fail (0.0 to 1.0)
             date_range_days: Number of days back to generate timestamps
+            seed: Optional seed for reproducible draws
             
         Returns:
             DataFrame with validation results structure
         """
+        cls = AutoDQTestDataFactory
         if tables is None:
-            tables = ['customers', 'orders', 'products', 'inventory', 'payments', 'users']
-        
-        columns_by_table = {
-            'customers': ['customer_id', 'email', 'phone', 'registration_date', 'status'],
-            'orders': ['order_id', 'customer_id', 'order_date', 'total_amount', 'status'],
-            'products': ['product_id', 'name', 'price', 'category', 'stock_quantity'],
-            'inventory': ['product_id', 'location', 'quantity', 'last_updated'],
-            'payments': ['payment_id', 'order_id', 'amount', 'payment_date', 'method'],
-            'users': ['user_id', 'username', 'email', 'created_at', 'is_active']
-        }
-        
-        rules = [
-            'No Nulls', 'Unique Values', 'Primary Key Present', 'Foreign Key Valid',
-            'Range OK', 'Valid Type', 'Format Match', 'Column Present', 
-            'Allowed Values', 'Valid Date'
-        ]
-        
-        metrics = [
-            'Column Values Not Null', 'Uniqueness Check', 'Primary Key Validation',
-            'Foreign Key Validation', 'Value Range Check', 'Data Type Validation',
-            'Format Validation', 'Column Existence Check', 'Domain Value Check',
-            'Date Format Validation'
-        ]
-        
-        data = []
-        for i in range(num_rows):
-            table = random.choice(tables)
-            column = random.choice(columns_by_table.get(table, ['unknown_column']))
-            rule = random.choice(rules)
-            metric = random.choice(metrics)
-            
-            # Determine status based on failure rate
-            status = 'Failed' if random.random() < failure_rate else 'Passed'
-            
-            # Generate timestamp within date range
-            days_back = random.randint(0, date_range_days)
-            hours_back = random.randint(0, 23)
-            timestamp = datetime.now() - timedelta(days=days_back, hours=hours_back)
-            
-            # Generate failed values for failed checks
-            failed_value = None
-            failed_row_id = None
-            if status == 'Failed':
-                failed_value = AutoDQTestDataFactory._generate_failed_value(rule)
-                failed_row_id = random.randint(1, 100000)
-            
-            data.append({
-                'Run_Timestamp': timestamp,
-                'Table': table,
-                'Column': column,
-                'Rule': rule,
-                'Status': status,
-                'Metric': metric,
-                'Failed_Value': failed_value,
-                'Failed_Row_ID': failed_row_id
-            })
-        
-        return pd.DataFrame(data)
+            tables_arr = cls._DEFAULT_TABLES
+        else:
+            tables_arr = np.asarray(tables, dtype=object)
+
+        # All draws happen as bulk NumPy calls instead of per-row
+        # random.choice/randint dispatches over a list of dicts
+        rng = np.random.default_rng(seed)
+
+        table_idx = rng.integers(0, len(tables_arr), num_rows)
+        table_arr = tables_arr[table_idx]
+
+        # Columns are table-dependent, so fill each table's rows in one
+        # masked draw from that table's pool
+        column_arr = np.empty(num_rows, dtype=object)
+        for table in tables_arr:
+            mask = table_arr == table
+            hits = int(mask.sum())
+            if hits:
+                pool = cls._COLS_BY_TABLE.get(table, cls._UNKNOWN_COLS)
+                column_arr[mask] = pool[rng.integers(0, len(pool), hits)]
+
+        rule_idx = rng.integers(0, len(cls._RULES), num_rows)
+        metric_idx = rng.integers(0, len(cls._METRICS), num_rows)
+
+        # Determine status based on failure rate
+        status_mask = rng.random(num_rows) < failure_rate
+        status_arr = np.where(status_mask, 'Failed', 'Passed')
+
+        # Generate timestamps within date range (days + hours collapsed
+        # into a single hour offset vector)
+        hours_back = (
+            rng.integers(0, date_range_days + 1, num_rows) * 24
+            + rng.integers(0, 24, num_rows)
+        )
+        timestamps = pd.Timestamp.now() - pd.to_timedelta(hours_back, unit='h')
+
+        # Generate failed values branchlessly: per-rule values and row ids
+        # are produced for every row in straight vectorized passes, then the
+        # status mask nulls out the passing rows — no data-dependent gather
+        failed_value = np.where(status_mask, cls._FAILED_VALUES[rule_idx], None)
+        # Nullable Int64 built directly from the drawn ints and the status
+        # mask — no object promotion and nothing for pandas to infer
+        failed_row_id = pd.arrays.IntegerArray(
+            rng.integers(1, 100001, size=num_rows), mask=~status_mask
+        )
+
+        # The low-cardinality string columns go in as categoricals; the
+        # draws above already produced the integer codes, so from_codes
+        # skips any string-to-category inference
+        return pd.DataFrame({
+            'Run_Timestamp': timestamps,
+            'Table': pd.Categorical.from_codes(table_idx, categories=list(tables_arr)),
+            'Column': pd.Categorical(column_arr),
+            'Rule': pd.Categorical.from_codes(rule_idx, categories=list(cls._RULES)),
+            'Status': pd.Categorical(status_arr, categories=['Passed', 'Failed']),
+            'Metric': pd.Categorical.from_codes(metric_idx, categories=list(cls._METRICS)),
+            'Failed_Value': failed_value,
+            'Failed_Row_ID': failed_row_id
+        }, copy=False)
     
     @staticmethod
+    @_memoize_seeded
     def create_user_defined_rules_data(
         num_rows: int = 20,
         tables: List[str] = None,
-        failure_rate: float = 0.3
+        failure_rate: float = 0.3,
+        seed: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Create test data for user-defined validation rules
         """
+        cls = AutoDQTestDataFactory
+        rng = np.random.default_rng(seed)
+
         if tables is None:
-            tables = ['inventory', 'sales', 'customers', 'orders']
-        
-        user_rules = [
-            'Custom Business Rule', 'Data Quality Check', 'Business Logic Validation',
-            'Custom Range Check', 'Cross-Table Validation', 'Complex Business Rule'
-        ]
-        
-        data = []
-        for i in range(num_rows):
-            table = random.choice(tables)
-            rule = 'User Generated Rule'  # This is the marker for user rules
-            metric = random.choice(user_rules)
-            status = 'Failed' if random.random() < failure_rate else 'Passed'
-            
-            timestamp = datetime.now() - timedelta(hours=random.randint(1, 168))  # Last week
-            
-            failed_value = None
-            failed_row_id = None
-            if status == 'Failed':
-                failed_value = f"custom_error_{i}"
-                failed_row_id = random.randint(1, 50000)
-            
-            data.append({
-                'Run_Timestamp': timestamp,
-                'Table': table,
-                'Column': f'custom_column_{i % 5}',
-                'Rule': rule,
-                'Status': status,
-                'Metric': metric,
-                'Failed_Value': failed_value,
-                'Failed_Row_ID': failed_row_id
-            })
-        
-        return pd.DataFrame(data)
+            tables_arr = cls._DEFAULT_USER_TABLES
+        else:
+            tables_arr = np.asarray(tables, dtype=object)
+
+        # Columnar construction: every column is one vectorized draw or
+        # string build, and the frame is assembled once from the arrays
+        table_col = rng.choice(tables_arr, size=num_rows)
+        metric_col = rng.choice(cls._USER_RULES, size=num_rows)
+        status_mask = rng.random(num_rows) < failure_rate
+        status_col = np.where(status_mask, 'Failed', 'Passed')
+
+        row_idx = np.arange(num_rows)
+        # Only 5 distinct names exist, so row_idx % 5 already is the
+        # categorical code — no per-row string building at all
+        column_codes = row_idx % 5
+
+        # Last week
+        timestamps = pd.Timestamp.now() - pd.to_timedelta(
+            rng.integers(1, 169, size=num_rows), unit='h'
+        )
+
+        # Branchless: build the error strings and ids for every row, then
+        # mask — row numbering still matches the row index as before
+        failed_value = np.where(
+            status_mask, np.char.add('custom_error_', row_idx.astype(str)), None
+        )
+        failed_row_id = pd.arrays.IntegerArray(
+            rng.integers(1, 50001, size=num_rows), mask=~status_mask
+        )
+
+        return pd.DataFrame({
+            'Run_Timestamp': timestamps,
+            'Table': pd.Categorical(table_col, categories=list(tables_arr)),
+            'Column': pd.Categorical.from_codes(
+                column_codes, categories=list(cls._CUSTOM_COLS)
+            ),
+            # Marker for user rules
+            'Rule': pd.Categorical(np.repeat('User Generated Rule', num_rows)),
+            'Status': pd.Categorical(status_col, categories=['Passed', 'Failed']),
+            'Metric': pd.Categorical(metric_col, categories=list(cls._USER_RULES)),
+            'Failed_Value': failed_value,
+            'Failed_Row_ID': failed_row_id
+        }, copy=False)
     
     @staticmethod
+    @_memoize_seeded
     def create_anomaly_detection_data(
         num_rows: int = 1000,
-        anomaly_rate: float = 0.05
+        anomaly_rate: float = 0.05,
+        seed: Optional[int] = 42
     ) -> pd.DataFrame:
         """
         Create test data suitable for anomaly detection testing
+
+        Seeded by default for reproducible results; the generator is local,
+        so callers' global NumPy random state is never touched.
         """
-        np.random.seed(42)  # For reproducible results
+        rng = np.random.default_rng(seed)
         
         # Generate normal data
         normal_size = int(num_rows * (1 - anomaly_rate))
         anomaly_size = num_rows - normal_size
         
-        # Normal data distribution
-        normal_values = np.random.normal(50, 10, normal_size)
-        normal_row_ids = np.random.randint(1, 100000, normal_size)
+        # Normal data distribution; float32 is plenty for test data and
+        # halves the bandwidth of the draws and downstream parsing
+        normal_values = rng.standard_normal(normal_size, dtype=np.float32) * 10 + 50
+        normal_row_ids = rng.integers(1, 100000, normal_size)
         
         # Anomalous data (outliers)
         anomaly_values = np.concatenate([
-            np.random.normal(200, 20, anomaly_size // 2),  # High outliers
-            np.random.normal(-50, 15, anomaly_size - anomaly_size // 2)  # Low outliers
+            # High outliers
+            rng.standard_normal(anomaly_size // 2, dtype=np.float32) * 20 + 200,
+            # Low outliers
+            rng.standard_normal(anomaly_size - anomaly_size // 2, dtype=np.float32) * 15 - 50
         ])
-        anomaly_row_ids = np.random.randint(1, 100000, anomaly_size)
+        anomaly_row_ids = rng.integers(1, 100000, anomaly_size)
         
         # Combine data
         all_values = np.concatenate([normal_values, anomaly_values])
         all_row_ids = np.concatenate([normal_row_ids, anomaly_row_ids])
         
-        # Shuffle to mix normal and anomalous data
-        indices = np.random.permutation(len(all_values))
-        all_values = all_values[indices]
-        all_row_ids = all_row_ids[indices]
+        # Shuffle to mix normal and anomalous data: both arrays are
+        # co-shuffled in place by replaying one generator state, so no
+        # auxiliary index array or gathered copies are allocated
+        shuffle_rng = np.random.default_rng(rng.integers(2**63))
+        state = shuffle_rng.bit_generator.state
+        shuffle_rng.shuffle(all_values)
+        shuffle_rng.bit_generator.state = state
+        shuffle_rng.shuffle(all_row_ids)
         
         data = {
-            'Failed_Value': all_values.astype(str),  # String format as it comes from DB
-            'Failed_Row_ID': all_row_ids.astype(str),
-            'Table': np.random.choice(['customers', 'orders', 'products'], num_rows),
-            'Column': np.random.choice(['amount', 'quantity', 'score', 'rating'], num_rows),
-            'Status': ['Failed'] * num_rows,  # All are failed for anomaly detection
-            'Run_Timestamp': [
-                datetime.now() - timedelta(hours=random.randint(1, 24))
-                for _ in range(num_rows)
-            ]
+            # String format as it comes from DB, rendered by C-level printf
+            # instead of astype(str)'s per-element repr
+            'Failed_Value': np.char.mod('%.4f', all_values),
+            # Typed view so consumers can skip the str->float round-trip
+            'Failed_Value_num': all_values,
+            'Failed_Row_ID': np.char.mod('%d', all_row_ids),
+            'Table': pd.Categorical(rng.choice(['customers', 'orders', 'products'], num_rows)),
+            'Column': pd.Categorical(rng.choice(['amount', 'quantity', 'score', 'rating'], num_rows)),
+            # All are failed for anomaly detection
+            'Status': pd.Categorical(np.repeat('Failed', num_rows), categories=['Passed', 'Failed']),
+            # One datetime64 vector instead of num_rows Python datetimes
+            'Run_Timestamp': pd.Timestamp.now() - pd.to_timedelta(
+                rng.integers(1, 25, size=num_rows), unit='h'
+            )
         }
         
         return pd.DataFrame(data)
     
     @staticmethod
-    def create_data_cleaning_test_data(num_rows: int = 50) -> pd.DataFrame:
+    @_memoize_seeded
+    def create_data_cleaning_test_data(num_rows: int = 50, seed: Optional[int] = None) -> pd.DataFrame:
         """
         Create test data with various data quality issues for cleaning tests
         """
-        data = {
-            'id': list(range(1, num_rows + 1)) + [num_rows - 1],  # Add duplicate
-            'name': [
-                'Alice Johnson', 'BOB SMITH', None, 'charlie brown', 'DAVID WILSON',
-                'emma davis', 'FRANK MILLER', 'grace taylor', None, 'HENRY CLARK'
-            ] + [f'Person_{i}' for i in range(10, num_rows)] + ['DAVID WILSON'],
-            'email': [
-                'alice@example.com', 'BOB@EXAMPLE.COM', None, 'charlie@test.com',
-                'david@company.org', 'emma@domain.net', 'FRANK@SITE.COM',
-                'grace@email.co', None, 'henry@web.org'
-            ] + [f'person{i}@test.com' for i in range(10, num_rows)] + ['david@company.org'],
-            'age': [25, 30, None, 35, 40, 28, 45, 33, None, 50] + 
-                  [random.randint(18, 80) for _ in range(10, num_rows)] + [40],
-            'score': [85.5, 92.0, None, 78.5, 95.0, 88.2, 91.7, 79.3, None, 87.8] +
-                    [round(random.uniform(60, 100), 1) for _ in range(10, num_rows)] + [95.0],
-            'category': ['A', 'b', None, 'C', 'a', 'B', 'c', 'A', None, 'b'] +
-                       [random.choice(['A', 'B', 'C', 'a', 'b', 'c']) for _ in range(10, num_rows)] + ['a']
-        }
-        
-        return pd.DataFrame(data)
+        # Each column is assembled as one preallocated/concatenated array —
+        # fixed head, vectorized filler, duplicate tail — handing pandas
+        # typed arrays instead of Python lists to re-infer
+        rng = np.random.default_rng(seed)
+        fill = max(0, num_rows - 10)
+        total = num_rows + 1  # duplicate tail row included
+        filler_idx = np.arange(10, num_rows)
+
+        id_col = np.append(np.arange(1, num_rows + 1), num_rows - 1)  # Add duplicate
+
+        name_col = np.empty(total, dtype=object)
+        name_col[:10] = [
+            'Alice Johnson', 'BOB SMITH', None, 'charlie brown', 'DAVID WILSON',
+            'emma davis', 'FRANK MILLER', 'grace taylor', None, 'HENRY CLARK'
+        ]
+        name_col[10:num_rows] = np.char.add('Person_', filler_idx.astype(str))
+        name_col[num_rows] = 'DAVID WILSON'
+
+        email_col = np.empty(total, dtype=object)
+        email_col[:10] = [
+            'alice@example.com', 'BOB@EXAMPLE.COM', None, 'charlie@test.com',
+            'david@company.org', 'emma@domain.net', 'FRANK@SITE.COM',
+            'grace@email.co', None, 'henry@web.org'
+        ]
+        email_col[10:num_rows] = np.char.add(
+            np.char.add('person', filler_idx.astype(str)), '@test.com'
+        )
+        email_col[num_rows] = 'david@company.org'
+
+        # Nulls as NaN in contiguous float64 arrays — the same dtype pandas
+        # inferred from the old int/None lists
+        age_col = np.concatenate((
+            np.array([25, 30, np.nan, 35, 40, 28, 45, 33, np.nan, 50]),
+            rng.integers(18, 81, size=fill).astype(np.float64),
+            [40.0]
+        ))
+        score_col = np.concatenate((
+            np.array([85.5, 92.0, np.nan, 78.5, 95.0, 88.2, 91.7, 79.3, np.nan, 87.8]),
+            np.round(rng.uniform(60, 100, size=fill), 1),
+            [95.0]
+        ))
+
+        category_col = np.empty(total, dtype=object)
+        category_col[:10] = ['A', 'b', None, 'C', 'a', 'B', 'c', 'A', None, 'b']
+        category_col[10:num_rows] = rng.choice(
+            np.array(['A', 'B', 'C', 'a', 'b', 'c']), size=fill
+        )
+        category_col[num_rows] = 'a'
+
+        return pd.DataFrame({
+            'id': id_col,
+            'name': name_col,
+            'email': email_col,
+            'age': age_col,
+            'score': score_col,
+            'category': category_col
+        })
     
     @staticmethod
     def _generate_failed_value(rule: str) -> str:
         """Generate realistic failed values based on the validation rule"""
-        failed_values = {
-            'No Nulls': None,
-            'Unique Values': 'duplicate_value',
-            'Primary Key Present': None,
-            'Foreign Key Valid': 'invalid_foreign_key_999999',
-            'Range OK': '-999',
-            'Valid Type': 'invalid_type_string',
-            'Format Match': 'invalid-format-123',
-            'Column Present': 'missing_column',
-            'Allowed Values': 'invalid_domain_value',
-            'Valid Date': '2023-13-45'  # Invalid date
-        }
-        
-        return failed_values.get(rule, 'generic_error_value')
+        return AutoDQTestDataFactory._FAILED_VALUES_BY_RULE.get(rule, 'generic_error_value')
     
     @staticmethod
-    def create_comprehensive_test_suite() -> Dict[str, pd.DataFrame]:
+    @_memoize_seeded
+    def create_comprehensive_test_suite(seed: Optional[int] = None) -> Dict[str, pd.DataFrame]:
         """
         Create a comprehensive set of test datasets for all AutoDQ components
+
+        The generated members are independent, so they are built
+        concurrently; each task draws from its own seed spawned off the
+        base seed, so a fixed seed reproduces the whole suite.
         """
-        return {
-            'validation_results': AutoDQTestDataFactory.create_validation_results_data(200),
-            'user_rules': AutoDQTestDataFactory.create_user_defined_rules_data(30),
-            'anomaly_data': AutoDQTestDataFactory.create_anomaly_detection_data(500),
-            'cleaning_data': AutoDQTestDataFactory.create_data_cleaning_test_data(100),
-            'empty_data': pd.DataFrame(),
-            'single_row': AutoDQTestDataFactory.create_validation_results_data(1),
-            'high_failure_rate': AutoDQTestDataFactory.create_validation_results_data(50, failure_rate=0.8),
-            'recent_data_only': AutoDQTestDataFactory.create_validation_results_data(
-                30, date_range_days=1
-            )
+        cls = AutoDQTestDataFactory
+        tasks = {
+            'validation_results': (cls.create_validation_results_data, {'num_rows': 200}),
+            'user_rules': (cls.create_user_defined_rules_data, {'num_rows': 30}),
+            'anomaly_data': (cls.create_anomaly_detection_data, {'num_rows': 500}),
+            'cleaning_data': (cls.create_data_cleaning_test_data, {'num_rows': 100}),
+            'single_row': (cls.create_validation_results_data, {'num_rows': 1}),
+            'high_failure_rate': (cls.create_validation_results_data, {'num_rows': 50, 'failure_rate': 0.8}),
+            'recent_data_only': (cls.create_validation_results_data, {'num_rows': 30, 'date_range_days': 1}),
         }
+        child_seeds = np.random.SeedSequence(seed).spawn(len(tasks))
+
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            futures = {
+                name: ex.submit(fn, seed=child_seed, **kwargs)
+                for (name, (fn, kwargs)), child_seed in zip(tasks.items(), child_seeds)
+            }
+            datasets = {name: future.result() for name, future in futures.items()}
+
+        datasets['empty_data'] = pd.DataFrame()
+        return datasets
     
     @staticmethod
     def save_test_datasets(datasets: Dict[str, pd.DataFrame], output_dir: str = "test_data"):
         """
-        Save test datasets to CSV files for use in testing
+        Save test datasets as zstd-compressed Parquet files for use in testing
+
+        Parquet keeps the categorical/datetime64 dtypes across the
+        round-trip and serializes through Arrow, which releases the GIL —
+        so the datasets are written concurrently.
         """
         import os
         os.makedirs(output_dir, exist_ok=True)
-        
-        for name, df in datasets.items():
-            filepath = os.path.join(output_dir, f"{name}.csv")
-            df.to_csv(filepath, index=False)
-            print(f"Saved {len(df)} rows to {filepath}")
+
+        def _save(item):
+            name, df = item
+            filepath = os.path.join(output_dir, f"{name}.parquet")
+            df.to_parquet(filepath, engine='pyarrow', compression='zstd')
+            return len(df), filepath
+
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            for rows, filepath in ex.map(_save, datasets.items()):
+                print(f"Saved {rows} rows to {filepath}")
 
 
 # Convenience functions for quick test data generation
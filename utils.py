@@ -1,21 +1,54 @@
 # utils.py
 
+import io
 import json
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+# orjson parses/serializes in C; fall back to the stdlib when it is not
+# installed (same pattern as environment_detector)
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _json_loads = json.loads
+
 def to_json(obj, path):
     """Save a Python dict as a JSON file."""
-    with open(path, 'w') as f:
-        json.dump(obj, f, indent=4)
+    Path(path).write_bytes(_json_dumps(obj))
 
 def from_json(path):
     """Load a Python dict from a JSON file."""
-    with open(path, 'r') as f:
-        return json.load(f)
+    return _json_loads(Path(path).read_bytes())
+
+@st.cache_data
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to CSV bytes once and reuse it across reruns.
+
+    The cache keys on the frame's content hash, so reruns return the bytes
+    without re-serializing; a cache miss encodes through Arrow's
+    multithreaded CSV writer instead of pandas' per-cell formatter.
+    """
+    # Imported lazily: utils loads on every page, the writer only on download
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    buf = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buf)
+    return buf.getvalue()
 
 def dataframe_to_csv_download(df: pd.DataFrame, file_name: str, label: str = "⬇ Download CSV"):
-    st.download_button(label, df.to_csv(index=False), file_name)
+    st.download_button(label, to_csv_bytes(df), file_name)
 
 def format_metric(value, default="N/A"):
     if value is None or pd.isna(value):
@@ -26,8 +59,25 @@ def format_metric(value, default="N/A"):
         return f"{value:,}"
     return str(value)
 
+def format_metrics_series(series: pd.Series, default="N/A") -> pd.Series:
+    """Format a whole Series for display in one dtype dispatch.
+
+    Equivalent to series.apply(format_metric), but the value type is
+    resolved once from the dtype instead of isinstance checks per cell.
+    """
+    if pd.api.types.is_float_dtype(series):
+        return series.map(lambda v: default if pd.isna(v) else f"{v:,.2f}")
+    if pd.api.types.is_integer_dtype(series):
+        return series.map(lambda v: default if pd.isna(v) else f"{v:,}")
+    return series.astype(str).where(series.notna(), default)
+
 def get_unique_list(series):
-    return sorted(series.dropna().unique().tolist())
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # unique() on a categorical dedupes over the integer codes and
+        # returns only the categories actually present
+        return sorted(series.dropna().unique().tolist())
+    # np.unique returns sorted output, so no separate sorted() pass
+    return np.unique(series.dropna().to_numpy()).tolist()
 
 def error_message_box(msg, details=None):
     st.error(msg)
@@ -44,11 +94,14 @@ def success_message_box(msg, details=None):
     if details:
         st.caption(details)
 
+# Column listings go through select_dtypes, which reads the dtypes from
+# the block manager once instead of materializing each column to check it
+
 def list_columns_by_dtype(df: pd.DataFrame, dtype="object"):
-    return [col for col in df.columns if df[col].dtype == dtype]
+    return df.select_dtypes(include=dtype).columns.tolist()
 
 def list_numeric_columns(df: pd.DataFrame):
-    return [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
+    return df.select_dtypes(include="number").columns.tolist()
 
 def list_datetime_columns(df: pd.DataFrame):
-    return [col for col in df.columns if pd.api.types.is_datetime64_any_dtype(df[col])]
+    return df.select_dtypes(include="datetime").columns.tolist()